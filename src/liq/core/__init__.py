@@ -5,12 +5,15 @@ This package provides the foundational data structures, enums, and type
 definitions used across the entire LIQ ecosystem.
 """
 
-from liq.core.bar import Bar
-from liq.core.cash_movement import CashMovement
-from liq.core.corporate_action import CorporateAction
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from liq.core.enums import (
+    ActionType,
     AssetClass,
     Currency,
+    EntryType,
+    MovementType,
     OrderSide,
     OrderStatus,
     OrderType,
@@ -18,17 +21,7 @@ from liq.core.enums import (
     Timeframe,
     TimeInForce,
 )
-from liq.core.fill import Fill
-from liq.core.instrument import Instrument, ProviderMetadata
-from liq.core.ledger import LedgerEntry
-from liq.core.order import OrderRequest
-from liq.core.portfolio import PortfolioState
-from liq.core.position import Position
-from liq.core.quote import Quote
 from liq.core.results import BatchResult, FetchResult, UpdateResult
-from liq.core.symbols import normalize_symbol, parse_symbol, validate_symbol
-from liq.core.trade import Trade
-from liq.core.validation import ValidationResult
 from liq.core.security import (
     REDACTED_SECRET_VALUE,
     SENSITIVE_CONTEXT_KEYS,
@@ -38,10 +31,66 @@ from liq.core.security import (
     redact_sensitive_payload,
     serialize_sensitive_payload,
 )
+from liq.core.symbols import (
+    normalize_symbol,
+    normalize_symbols,
+    parse_symbol,
+    validate_symbol,
+)
+from liq.core.validation import ValidationResult
+
+if TYPE_CHECKING:
+    from liq.core.bar import Bar
+    from liq.core.bar_frame import BarFrame
+    from liq.core.cash_movement import CashMovement
+    from liq.core.corporate_action import CorporateAction
+    from liq.core.fill import Fill
+    from liq.core.instrument import Instrument, ProviderMetadata
+    from liq.core.ledger import LedgerEntry
+    from liq.core.order import OrderRequest
+    from liq.core.portfolio import PortfolioState
+    from liq.core.position import Position
+    from liq.core.quote import Quote
+    from liq.core.quote_batch import QuoteBatch
+    from liq.core.trade import Trade
+
+# Pydantic models are imported on first attribute access (PEP 562) so that
+# importing liq.core for enums or symbol helpers does not build every schema.
+_LAZY_MODELS = {
+    "Bar": "liq.core.bar",
+    "BarFrame": "liq.core.bar_frame",
+    "CashMovement": "liq.core.cash_movement",
+    "CorporateAction": "liq.core.corporate_action",
+    "Fill": "liq.core.fill",
+    "Instrument": "liq.core.instrument",
+    "LedgerEntry": "liq.core.ledger",
+    "OrderRequest": "liq.core.order",
+    "PortfolioState": "liq.core.portfolio",
+    "Position": "liq.core.position",
+    "ProviderMetadata": "liq.core.instrument",
+    "Quote": "liq.core.quote",
+    "QuoteBatch": "liq.core.quote_batch",
+    "Trade": "liq.core.trade",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_MODELS))
+
 
 __all__ = [
     # Models
     "Bar",
+    "BarFrame",
     "BatchResult",
     "CashMovement",
     "CorporateAction",
@@ -54,12 +103,16 @@ __all__ = [
     "Position",
     "ProviderMetadata",
     "Quote",
+    "QuoteBatch",
     "Trade",
     "UpdateResult",
     "ValidationResult",
     # Enums
+    "ActionType",
     "AssetClass",
     "Currency",
+    "EntryType",
+    "MovementType",
     "OrderSide",
     "OrderStatus",
     "OrderType",
@@ -68,6 +121,7 @@ __all__ = [
     "TimeInForce",
     # Symbol utilities
     "normalize_symbol",
+    "normalize_symbols",
     "parse_symbol",
     "validate_symbol",
     # Security helpers
@@ -0,0 +1,40 @@
+"""Shared pydantic base classes for the LIQ Stack models."""
+
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, ClassVar, Self
+
+from pydantic import BaseModel
+
+
+class CachedPropertyModel(BaseModel):
+    """Frozen-model base whose ``cached_property`` values survive copying safely.
+
+    Derived values on frozen models can be computed once and cached in the
+    instance ``__dict__``. ``model_copy`` copies that dict, so a copy with
+    ``update`` would otherwise keep values computed from the old fields;
+    this base drops every cached value from such copies.
+    """
+
+    _cached_property_names: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._cached_property_names = tuple(
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, cached_property)
+        )
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, dropping cached derived values when fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            cached = copied.__dict__
+            for name in self._cached_property_names:
+                cached.pop(name, None)
+        return copied
@@ -0,0 +1,78 @@
+"""Trusted model construction without pydantic validation.
+
+``BaseModel.model_construct`` walks every field to resolve aliases and
+defaults, which makes it nearly as slow as full validation for the small
+frozen models in this package. The helper here sets instance state directly
+for callers that already hold a complete, validated set of field values.
+
+Trusted instances with the same explicitly-set field names share one
+``__pydantic_fields_set__`` object rather than each carrying its own set,
+which is the largest per-instance allocation after ``__dict__``. pydantic
+copies that set before changing it in ``model_copy``, so it is never
+mutated in place.
+"""
+
+from collections.abc import Iterable
+from functools import cache, lru_cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_new = object.__new__
+# BaseModel's slot descriptors, called directly to skip the MRO lookup that
+# object.__setattr__ does on every assignment.
+_set_dict = vars(BaseModel)["__dict__"].__set__
+_set_fields_set = vars(BaseModel)["__pydantic_fields_set__"].__set__
+_set_extra = vars(BaseModel)["__pydantic_extra__"].__set__
+_set_private = vars(BaseModel)["__pydantic_private__"].__set__
+
+
+@lru_cache(maxsize=256)
+def _shared_fields_set(names: frozenset[str]) -> set[str]:
+    return set(names)
+
+
+def construct_trusted(
+    cls: type[ModelT],
+    values: dict[str, Any],
+    fields_set: Iterable[str] | None = None,
+) -> ModelT:
+    """Build a model instance from already-validated field values.
+
+    Equivalent to ``cls.model_construct(**values)`` when ``values`` holds
+    every field and the model has no private attributes. No validation or
+    coercion runs; the dict is adopted as the instance ``__dict__``.
+
+    Args:
+        cls: Model class to instantiate
+        values: Mapping of every field name to its final value
+        fields_set: Names of explicitly provided fields (default: every
+            key of ``values``); the resulting set is shared between
+            instances and must not be mutated
+
+    Returns:
+        New model instance
+    """
+    obj = _new(cls)
+    _set_dict(obj, values)
+    names = frozenset(values if fields_set is None else fields_set)
+    _set_fields_set(obj, _shared_fields_set(names))
+    _set_extra(obj, None)
+    _set_private(obj, None)
+    return obj
+
+
+@cache
+def field_defaults(cls: type[BaseModel]) -> dict[str, Any]:
+    """Return the static default of every optional field on ``cls``.
+
+    Fields with a ``default_factory`` are omitted because their value must
+    be built per instance. The returned dict is shared; copy before mutating.
+    """
+    return {
+        name: field.default
+        for name, field in cls.model_fields.items()
+        if not field.is_required() and field.default_factory is None
+    }
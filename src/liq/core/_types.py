@@ -0,0 +1,22 @@
+"""Shared annotated field types for the LIQ Stack models."""
+
+from decimal import Decimal
+from typing import Annotated, Any
+
+from pydantic import GetCoreSchemaHandler, GetPydanticSchema
+from pydantic_core import CoreSchema, core_schema
+
+
+def _serialize_as_string(source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+    schema = handler(source)
+    schema["serialization"] = core_schema.to_string_ser_schema(when_used="always")
+    return schema
+
+
+# Annotation marker: dump the value as str(value) in both Python and JSON
+# mode. The conversion runs inside pydantic-core rather than through a
+# Python field_serializer callback per field.
+AsString = GetPydanticSchema(_serialize_as_string)
+
+# Decimal that dumps as its exact string form
+DecimalStr = Annotated[Decimal, AsString]
@@ -0,0 +1,98 @@
+"""Shared field checks for the LIQ Stack models.
+
+``canonical_symbol`` is the memoized symbol normalizer used by every model
+with a canonical symbol. ``check_aware`` is the naive-datetime check shared
+by field validators and the columnar builders. ``require_aware`` wraps it
+and is registered directly with ``field_validator`` so models share one
+callable; its error message names the field being validated.
+``validate_columns`` is the row-by-row check behind the columnar builders
+(``Bar.from_arrays``, ``BarFrame`` and ``QuoteBatch``).
+"""
+
+import sys
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from pydantic import ValidationInfo
+
+from liq.core.symbols import validate_symbol
+
+
+@lru_cache(maxsize=4096)
+def canonical_symbol(symbol: str) -> str:
+    """Return the uppercase canonical symbol or raise ValueError.
+
+    The result is interned, so every model holding the same symbol shares
+    one string object and symbol-keyed lookups hit the identity fast path.
+    """
+    normalized = symbol.strip()
+    if not normalized.isupper():
+        normalized = normalized.upper()
+    if not validate_symbol(normalized):
+        raise ValueError("symbol must be canonical (uppercase with _ or -)")
+    return sys.intern(normalized)
+
+
+def check_aware(ts: datetime, field: str) -> None:
+    """Raise ValueError naming ``field`` if ts is a naive datetime."""
+    # tzinfo.utcoffset(ts) gives the same answer as ts.utcoffset() without
+    # the datetime method's result checks, at about a third of the cost.
+    tz = ts.tzinfo
+    if tz is None or tz.utcoffset(ts) is None:
+        raise ValueError(f"{field} must be timezone-aware (UTC expected)")
+
+
+def require_aware(v: datetime | None, info: ValidationInfo) -> datetime | None:
+    """Field validator: reject naive datetimes (None passes through)."""
+    if v is not None:
+        check_aware(v, info.field_name or "value")
+    return v
+
+
+def validate_columns(
+    timestamps: Sequence[datetime],
+    symbol: str | Sequence[str],
+    columns: Sequence[Sequence[Any]],
+    check_row: Callable[..., None],
+) -> list[str]:
+    """Validate columnar rows and return the canonical symbol for each row.
+
+    A scalar ``symbol`` is normalized once for all rows; a symbol column is
+    normalized once per distinct raw value. ``check_row`` is called with the
+    row's timestamp followed by the row's value from each of ``columns`` and
+    raises ValueError for an invalid row.
+
+    Raises:
+        ValueError: If column lengths differ or a row fails validation
+            (the message includes the row index)
+    """
+    n = len(timestamps)
+    lengths = [len(col) for col in columns]
+    if not isinstance(symbol, str):
+        lengths.append(len(symbol))
+    if any(length != n for length in lengths):
+        raise ValueError("all columns must have the same length")
+
+    if isinstance(symbol, str):
+        symbols = [canonical_symbol(symbol)] * n
+    else:
+        cache: dict[str, str] = {}
+        symbols = []
+        for i, raw in enumerate(symbol):
+            normalized = cache.get(raw)
+            if normalized is None:
+                try:
+                    normalized = canonical_symbol(raw)
+                except ValueError as exc:
+                    raise ValueError(f"row {i}: {exc}") from None
+                cache[raw] = normalized
+            symbols.append(normalized)
+
+    for i, row in enumerate(zip(timestamps, *columns, strict=True)):
+        try:
+            check_row(*row)
+        except ValueError as exc:
+            raise ValueError(f"row {i}: {exc}") from None
+    return symbols
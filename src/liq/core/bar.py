@@ -4,21 +4,129 @@ The Bar model represents a single time period of trading activity,
 with Open, High, Low, Close prices and Volume.
 """
 
-from datetime import UTC, datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import cached_property
+from typing import Any
 
 from pydantic import (
-    BaseModel,
     ConfigDict,
-    field_serializer,
     field_validator,
     model_validator,
 )
 
-from liq.core.symbols import validate_symbol
+from liq.core._base import CachedPropertyModel
+from liq.core._construct import construct_trusted
+from liq.core._types import DecimalStr
+from liq.core._validators import canonical_symbol, check_aware, validate_columns
 
+# Pre-built Decimal operand so midrange avoids an int -> Decimal coercion per call
+_TWO = Decimal(2)
+_ZERO = Decimal(0)
+# UTC offset compared against directly instead of calling UTC.utcoffset per bar
+_UTC_OFFSET = timedelta(0)
 
-class Bar(BaseModel):
+
+def _check_timestamp(ts: datetime) -> None:
+    """Raise ValueError unless ts is timezone-aware UTC."""
+    check_aware(ts, "timestamp")
+    if ts.utcoffset() != _UTC_OFFSET:
+        raise ValueError("timestamp must be UTC")
+
+
+def _check_ohlcv(
+    open_: Decimal, high: Decimal, low: Decimal, close: Decimal, volume: Decimal
+) -> None:
+    """Raise ValueError unless prices are positive and OHLC is consistent."""
+    # Valid bars pass six comparisons: low > 0 with low <= open/close <= high
+    # implies every price is positive and high >= low. Only a failing bar
+    # walks the individual checks below to pick the error message.
+    if (
+        low > _ZERO
+        and low <= open_
+        and low <= close
+        and high >= open_
+        and high >= close
+        and volume >= _ZERO
+    ):
+        return
+    if open_ <= _ZERO or high <= _ZERO or low <= _ZERO or close <= _ZERO:
+        raise ValueError("price fields must be > 0")
+    if volume < _ZERO:
+        raise ValueError("volume must be >= 0")
+    _check_ohlc(open_, high, low, close)
+
+
+def _check_ohlc(open_: Decimal, high: Decimal, low: Decimal, close: Decimal) -> None:
+    """Raise ValueError unless the OHLC price relationships hold."""
+    if high < low:
+        raise ValueError("high must be >= low")
+    if high < open_:
+        raise ValueError("high must be >= open")
+    if high < close:
+        raise ValueError("high must be >= close")
+    if low > open_:
+        raise ValueError("low must be <= open")
+    if low > close:
+        raise ValueError("low must be <= close")
+
+
+def _check_row(
+    timestamp: datetime,
+    open_: Decimal,
+    high: Decimal,
+    low: Decimal,
+    close: Decimal,
+    volume: Decimal,
+) -> None:
+    """Raise ValueError unless one columnar bar row is valid."""
+    _check_timestamp(timestamp)
+    _check_ohlcv(open_, high, low, close, volume)
+
+
+def _validate_columns(
+    timestamps: Sequence[datetime],
+    symbol: str | Sequence[str],
+    opens: Sequence[Decimal],
+    highs: Sequence[Decimal],
+    lows: Sequence[Decimal],
+    closes: Sequence[Decimal],
+    volumes: Sequence[Decimal],
+) -> list[str]:
+    """Validate OHLCV columns row by row and return the canonical symbols."""
+    return validate_columns(
+        timestamps, symbol, (opens, highs, lows, closes, volumes), _check_row
+    )
+
+
+def _true_range_hl_columns(
+    highs: Sequence[Decimal], lows: Sequence[Decimal]
+) -> list[Decimal]:
+    """Gap-aware high/low true range for parallel high and low columns.
+
+    Each row's true range is the largest of its range and the absolute
+    high and low gaps to the prior row; the first row has no prior row.
+    """
+    out: list[Decimal] = []
+    prev_high: Decimal | None = None
+    prev_low: Decimal | None = None
+    for high, low in zip(highs, lows, strict=True):
+        tr = high - low
+        if prev_high is not None and prev_low is not None:
+            gap = abs(high - prev_high)
+            if gap > tr:
+                tr = gap
+            gap = abs(low - prev_low)
+            if gap > tr:
+                tr = gap
+        out.append(tr)
+        prev_high = high
+        prev_low = low
+    return out
+
+
+class Bar(CachedPropertyModel):
     """OHLCV bar (candle) representing a single time period of trading.
 
     Attributes:
@@ -30,7 +138,7 @@ class Bar(BaseModel):
         close: Closing price
         volume: Trading volume (>= 0)
 
-    Computed Properties:
+    Computed Properties (cached):
         midrange: (high + low) / 2
         range: high - low
 
@@ -40,45 +148,42 @@ class Bar(BaseModel):
         - low <= open and low <= close
         - volume >= 0
         - timestamp must be timezone-aware (UTC)
+
+    Construction:
+        - ``Bar(...)`` / ``model_validate``: untrusted or loosely typed input;
+          coerces types and reports every invalid field in a ValidationError
+        - ``from_values``: one bar from values that are already ``Decimal`` and
+          ``datetime``; same checks, no coercion, first error as ValueError
+        - ``from_arrays``: many bars from typed columns in one checked pass
+        - ``construct_unchecked``: trusted, already-validated values; no checks
     """
 
     model_config = ConfigDict(
         frozen=True,
-        str_strip_whitespace=True,
     )
 
     timestamp: datetime
     symbol: str
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
+    open: DecimalStr
+    high: DecimalStr
+    low: DecimalStr
+    close: DecimalStr
+    volume: DecimalStr
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol_format(cls, v: str) -> str:
-        """Normalize and validate symbol format."""
-        normalized = v.strip().upper()
-        if not validate_symbol(normalized):
-            raise ValueError("symbol must be canonical (uppercase with _ or -)")
-        return normalized
+    validate_symbol_format = field_validator("symbol")(canonical_symbol)
 
     @field_validator("timestamp")
     @classmethod
     def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp is timezone-aware."""
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        if v.utcoffset() != UTC.utcoffset(v):
-            raise ValueError("timestamp must be UTC")
+        """Ensure timestamp is timezone-aware UTC."""
+        _check_timestamp(v)
         return v
 
     @field_validator("open", "high", "low", "close")
     @classmethod
     def validate_price_positive(cls, v: Decimal) -> Decimal:
         """Ensure OHLC prices are positive."""
-        if v <= 0:
+        if v <= _ZERO:
             raise ValueError("price fields must be > 0")
         return v
 
@@ -86,61 +191,187 @@ class Bar(BaseModel):
     @classmethod
     def validate_volume_non_negative(cls, v: Decimal) -> Decimal:
         """Ensure volume is non-negative."""
-        if v < 0:
+        if v < _ZERO:
             raise ValueError("volume must be >= 0")
         return v
 
     @model_validator(mode="after")
     def validate_ohlc_constraints(self) -> "Bar":
         """Validate OHLC price relationships."""
-        if self.high < self.low:
-            raise ValueError("high must be >= low")
-        if self.high < self.open:
-            raise ValueError("high must be >= open")
-        if self.high < self.close:
-            raise ValueError("high must be >= close")
-        if self.low > self.open:
-            raise ValueError("low must be <= open")
-        if self.low > self.close:
-            raise ValueError("low must be <= close")
+        _check_ohlc(self.open, self.high, self.low, self.close)
         return self
 
-    @property
+    @classmethod
+    def from_arrays(
+        cls,
+        timestamps: Sequence[datetime],
+        symbol: str | Sequence[str],
+        opens: Sequence[Decimal],
+        highs: Sequence[Decimal],
+        lows: Sequence[Decimal],
+        closes: Sequence[Decimal],
+        volumes: Sequence[Decimal],
+    ) -> list["Bar"]:
+        """Build bars from column sequences with a single validation pass.
+
+        Runs the same checks as the model validator in one loop and builds
+        each bar without a per-row pydantic validation round-trip. A scalar
+        ``symbol`` is normalized once for all rows. Price and volume values
+        must already be ``Decimal``.
+
+        Args:
+            timestamps: Bar start times (UTC, timezone-aware)
+            symbol: One symbol for every row, or one symbol per row
+            opens: Opening prices
+            highs: High prices
+            lows: Low prices
+            closes: Closing prices
+            volumes: Volumes
+
+        Returns:
+            List of bars in input order
+
+        Raises:
+            ValueError: If column lengths differ or a row fails validation
+                (the message includes the row index)
+        """
+        symbols = _validate_columns(
+            timestamps, symbol, opens, highs, lows, closes, volumes
+        )
+        return [
+            construct_trusted(
+                cls,
+                {
+                    "timestamp": timestamps[i],
+                    "symbol": symbols[i],
+                    "open": opens[i],
+                    "high": highs[i],
+                    "low": lows[i],
+                    "close": closes[i],
+                    "volume": volumes[i],
+                },
+            )
+            for i in range(len(symbols))
+        ]
+
+    @classmethod
+    def from_values(
+        cls,
+        timestamp: datetime,
+        symbol: str,
+        open: Decimal,
+        high: Decimal,
+        low: Decimal,
+        close: Decimal,
+        volume: Decimal,
+    ) -> "Bar":
+        """Build one bar from already-typed values, checked without pydantic.
+
+        Runs the same symbol, timestamp, and OHLCV checks as model
+        validation, but applies no type coercion: prices and volume must
+        already be ``Decimal`` and ``timestamp`` a ``datetime``. Errors are
+        raised as a plain ValueError for the first failing check.
+
+        Raises:
+            ValueError: If any check fails
+        """
+        symbol = canonical_symbol(symbol)
+        _check_row(timestamp, open, high, low, close, volume)
+        return construct_trusted(
+            cls,
+            {
+                "timestamp": timestamp,
+                "symbol": symbol,
+                "open": open,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+            },
+        )
+
+    @classmethod
+    def construct_unchecked(cls, **values: Any) -> "Bar":
+        """Build a bar from trusted values without validation.
+
+        For loaders whose rows were validated and normalized upstream (for
+        example, bars written by this package and read back). No checks or
+        coercion run: the caller guarantees the symbol is canonical, the
+        timestamp is timezone-aware UTC, and prices and volume are ``Decimal``
+        values satisfying the OHLCV invariants. Every field must be given.
+        """
+        return construct_trusted(cls, values)
+
+    @cached_property
     def midrange(self) -> Decimal:
         """Calculate midrange: (high + low) / 2.
 
         The midrange provides a range-invariant price reference point,
-        useful for directional-change and range-bar strategies.
+        useful for directional-change and range-bar strategies. Computed
+        once per bar and cached.
         """
-        return (self.high + self.low) / 2
+        return (self.high + self.low) / _TWO
 
-    @property
+    @cached_property
     def range(self) -> Decimal:
         """Calculate range: high - low.
 
-        The range represents intrabar price movement.
+        The range represents intrabar price movement. Computed once per bar
+        and cached.
         """
         return self.high - self.low
 
     def true_range_midrange(self, prev_midrange: Decimal | None) -> Decimal:
         """Gap-aware true range using midrange vs prior bar."""
-        current_mid = self.midrange
+        tr = self.range
         if prev_midrange is None:
-            return self.range
-        return max(self.range, abs(current_mid - prev_midrange))
+            return tr
+        gap = abs(self.midrange - prev_midrange)
+        return gap if gap > tr else tr
 
     def true_range_hl(
         self, prev_high: Decimal | None, prev_low: Decimal | None
     ) -> Decimal:
         """Gap-aware true range using high/low vs prior bar."""
-        candidates = [self.range]
+        tr = self.range
         if prev_high is not None:
-            candidates.append(abs(self.high - prev_high))
+            gap = abs(self.high - prev_high)
+            if gap > tr:
+                tr = gap
         if prev_low is not None:
-            candidates.append(abs(self.low - prev_low))
-        return max(candidates)
+            gap = abs(self.low - prev_low)
+            if gap > tr:
+                tr = gap
+        return tr
+
+    @staticmethod
+    def true_range_hl_batch(bars: Sequence["Bar"]) -> list[Decimal]:
+        """Gap-aware high/low true range for each bar in a series.
 
-    @field_serializer("open", "high", "low", "close", "volume")
-    def serialize_decimal(self, v: Decimal) -> str:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v)
+        Equivalent to calling ``true_range_hl`` on each bar with the prior
+        bar's high and low, but runs as a single loop. The first bar has no
+        prior bar, so its true range is its range.
+        """
+        return _true_range_hl_columns(
+            [bar.high for bar in bars], [bar.low for bar in bars]
+        )
+
+    @staticmethod
+    def true_range_midrange_batch(bars: Sequence["Bar"]) -> list[Decimal]:
+        """Gap-aware midrange true range for each bar in a series.
+
+        Equivalent to calling ``true_range_midrange`` on each bar with the
+        prior bar's midrange, but runs as a single loop.
+        """
+        out: list[Decimal] = []
+        prev_mid: Decimal | None = None
+        for bar in bars:
+            tr = bar.range
+            mid = bar.midrange
+            if prev_mid is not None:
+                gap = abs(mid - prev_mid)
+                if gap > tr:
+                    tr = gap
+            out.append(tr)
+            prev_mid = mid
+        return out
@@ -0,0 +1,139 @@
+"""Columnar bar storage for the LIQ Stack.
+
+A BarFrame holds a bar series as parallel column tuples instead of one
+``Bar`` model per row, avoiding a model instance and ``__dict__`` for every
+bar in bulk histories. ``Bar`` remains the single-bar API: rows are
+materialized on demand with ``BarFrame.row``.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from liq.core._construct import construct_trusted
+from liq.core.bar import Bar, _true_range_hl_columns, _validate_columns
+
+
+@dataclass(frozen=True, slots=True)
+class BarFrame:
+    """Validated bar series stored column by column.
+
+    Build instances with ``from_columns`` or ``from_bars`` so rows are
+    validated; the columns are then trusted when rows are materialized.
+
+    Attributes:
+        timestamps: Bar start times (UTC, timezone-aware)
+        symbols: Canonical symbol per row (repeated values share one string)
+        opens: Opening prices
+        highs: High prices
+        lows: Low prices
+        closes: Closing prices
+        volumes: Volumes
+
+    Example:
+        frame = BarFrame.from_columns(ts, "EUR_USD", o, h, l, c, v)
+        atr_input = frame.true_range_hl()
+        last = frame.row(-1)
+    """
+
+    timestamps: tuple[datetime, ...]
+    symbols: tuple[str, ...]
+    opens: tuple[Decimal, ...]
+    highs: tuple[Decimal, ...]
+    lows: tuple[Decimal, ...]
+    closes: tuple[Decimal, ...]
+    volumes: tuple[Decimal, ...]
+
+    @classmethod
+    def from_columns(
+        cls,
+        timestamps: Sequence[datetime],
+        symbol: str | Sequence[str],
+        opens: Sequence[Decimal],
+        highs: Sequence[Decimal],
+        lows: Sequence[Decimal],
+        closes: Sequence[Decimal],
+        volumes: Sequence[Decimal],
+    ) -> "BarFrame":
+        """Validate column sequences and store them as a frame.
+
+        Applies the same checks as ``Bar`` construction. Price and volume
+        values must already be ``Decimal``.
+
+        Args:
+            timestamps: Bar start times (UTC, timezone-aware)
+            symbol: One symbol for every row, or one symbol per row
+            opens: Opening prices
+            highs: High prices
+            lows: Low prices
+            closes: Closing prices
+            volumes: Volumes
+
+        Returns:
+            Validated frame
+
+        Raises:
+            ValueError: If column lengths differ or a row fails validation
+                (the message includes the row index)
+        """
+        symbols = _validate_columns(
+            timestamps, symbol, opens, highs, lows, closes, volumes
+        )
+        return cls(
+            tuple(timestamps),
+            tuple(symbols),
+            tuple(opens),
+            tuple(highs),
+            tuple(lows),
+            tuple(closes),
+            tuple(volumes),
+        )
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[Bar]) -> "BarFrame":
+        """Collect already-validated bars into a frame."""
+        return cls(
+            tuple(b.timestamp for b in bars),
+            tuple(b.symbol for b in bars),
+            tuple(b.open for b in bars),
+            tuple(b.high for b in bars),
+            tuple(b.low for b in bars),
+            tuple(b.close for b in bars),
+            tuple(b.volume for b in bars),
+        )
+
+    def __len__(self) -> int:
+        """Number of bars in the frame."""
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[Bar]:
+        """Iterate over rows as Bar models."""
+        for i in range(len(self.timestamps)):
+            yield self.row(i)
+
+    def row(self, i: int) -> Bar:
+        """Materialize row ``i`` as a Bar without re-validating it."""
+        return construct_trusted(
+            Bar,
+            {
+                "timestamp": self.timestamps[i],
+                "symbol": self.symbols[i],
+                "open": self.opens[i],
+                "high": self.highs[i],
+                "low": self.lows[i],
+                "close": self.closes[i],
+                "volume": self.volumes[i],
+            },
+        )
+
+    def to_bars(self) -> list[Bar]:
+        """Materialize every row as a Bar."""
+        return [self.row(i) for i in range(len(self.timestamps))]
+
+    def true_range_hl(self) -> list[Decimal]:
+        """Gap-aware high/low true range per row, computed from the columns.
+
+        Shares its implementation with ``Bar.true_range_hl_batch``.
+        """
+        return _true_range_hl_columns(self.highs, self.lows)
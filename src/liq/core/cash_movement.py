@@ -3,9 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
-from liq.core.enums import Currency
+from liq.core._validators import require_aware
+from liq.core.enums import Currency, MovementType
 
 
 class CashMovement(BaseModel):
@@ -16,12 +17,7 @@ class CashMovement(BaseModel):
     timestamp: datetime
     amount: Decimal
     currency: Currency
-    movement_type: str = Field(pattern="^(deposit|withdrawal|dividend|interest|fee)$")
+    movement_type: MovementType
     description: str | None = None
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
@@ -3,7 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from liq.core._validators import require_aware
+from liq.core.enums import ActionType
 
 
 class CorporateAction(BaseModel):
@@ -13,13 +16,8 @@ class CorporateAction(BaseModel):
 
     symbol: str
     ex_date: datetime
-    action_type: str = Field(pattern="^(split|dividend|spinoff|merger)$")
+    action_type: ActionType
     ratio: Decimal | None = None
     amount: Decimal | None = None
 
-    @field_validator("ex_date")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("ex_date must be timezone-aware (UTC expected)")
-        return v
+    validate_timestamp_timezone = field_validator("ex_date")(require_aware)
@@ -157,3 +157,53 @@ class OrderStatus(StrEnum):
     FILLED = "filled"
     CANCELLED = "cancelled"
     REJECTED = "rejected"
+
+
+class MovementType(StrEnum):
+    """Kind of cash movement.
+
+    Attributes:
+        DEPOSIT: Cash added to the account
+        WITHDRAWAL: Cash removed from the account
+        DIVIDEND: Dividend payment received
+        INTEREST: Interest credited or charged
+        FEE: Fee charged by the broker or venue
+    """
+
+    DEPOSIT = "deposit"
+    WITHDRAWAL = "withdrawal"
+    DIVIDEND = "dividend"
+    INTEREST = "interest"
+    FEE = "fee"
+
+
+class ActionType(StrEnum):
+    """Kind of corporate action.
+
+    Attributes:
+        SPLIT: Stock split (see ratio)
+        DIVIDEND: Cash dividend (see amount)
+        SPINOFF: Spinoff of a new entity
+        MERGER: Merger or acquisition
+    """
+
+    SPLIT = "split"
+    DIVIDEND = "dividend"
+    SPINOFF = "spinoff"
+    MERGER = "merger"
+
+
+class EntryType(StrEnum):
+    """Kind of ledger entry.
+
+    Attributes:
+        FILL: Order execution (requires fill)
+        CASH: Cash movement (requires cash_movement)
+        CORPORATE_ACTION: Corporate action (requires corporate_action)
+        MARGIN_CALL: Margin call event
+    """
+
+    FILL = "fill"
+    CASH = "cash"
+    CORPORATE_ACTION = "corporate_action"
+    MARGIN_CALL = "margin_call"
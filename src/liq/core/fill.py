@@ -5,12 +5,16 @@ The Fill model represents a completed execution of all or part of an order.
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
+from liq.core._types import AsString, DecimalStr
+from liq.core._validators import canonical_symbol, require_aware
 from liq.core.enums import OrderSide
-from liq.core.symbols import validate_symbol
+
+_ZERO = Decimal(0)
 
 
 class Fill(BaseModel):
@@ -46,39 +50,25 @@ class Fill(BaseModel):
     fill_id: UUID
     client_order_id: UUID
     symbol: str
-    side: OrderSide
-    quantity: Decimal
-    price: Decimal
-    commission: Decimal
-    slippage: Decimal | None = None
-    realized_pnl: Decimal | None = None
+    side: Annotated[OrderSide, AsString]
+    quantity: DecimalStr
+    price: DecimalStr
+    commission: DecimalStr
+    slippage: DecimalStr | None = None
+    realized_pnl: DecimalStr | None = None
     exchange_order_id: str | None = None
     provider: str | None = None
     is_partial: bool | None = None
     timestamp: datetime
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol_format(cls, v: str) -> str:
-        """Normalize and validate symbol format."""
-        normalized = v.strip().upper()
-        if not validate_symbol(normalized):
-            raise ValueError("symbol must be canonical (uppercase with _ or -)")
-        return normalized
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp is timezone-aware."""
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
+    validate_symbol_format = field_validator("symbol")(canonical_symbol)
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
 
     @field_validator("quantity")
     @classmethod
     def validate_quantity_positive(cls, v: Decimal) -> Decimal:
         """Ensure quantity is positive."""
-        if v <= 0:
+        if v <= _ZERO:
             raise ValueError("quantity must be > 0")
         return v
 
@@ -86,7 +76,7 @@ class Fill(BaseModel):
     @classmethod
     def validate_price_positive(cls, v: Decimal) -> Decimal:
         """Ensure price is positive."""
-        if v <= 0:
+        if v <= _ZERO:
             raise ValueError("price must be > 0")
         return v
 
@@ -94,7 +84,7 @@ class Fill(BaseModel):
     @classmethod
     def validate_commission_non_negative(cls, v: Decimal) -> Decimal:
         """Ensure commission is non-negative."""
-        if v < 0:
+        if v < _ZERO:
             raise ValueError("commission must be >= 0")
         return v
 
@@ -110,22 +100,7 @@ class Fill(BaseModel):
         For buys: +notional + commission (cash outflow)
         For sells: -notional + commission (net cash inflow)
         """
-        if self.side == OrderSide.BUY:
+        if self.side is OrderSide.BUY:
             return self.notional_value + self.commission
         else:
             return -self.notional_value + self.commission
-
-    @field_serializer("quantity", "price", "commission", "slippage", "realized_pnl")
-    def serialize_decimal(self, v: Decimal | None) -> str | None:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v) if v is not None else None
-
-    @field_serializer("side")
-    def serialize_side(self, v: OrderSide) -> str:
-        """Serialize OrderSide as string."""
-        return str(v)
-
-    @field_serializer("provider")
-    def serialize_provider(self, v: str | None) -> str | None:
-        """Serialize provider."""
-        return v
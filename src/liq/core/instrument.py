@@ -4,11 +4,12 @@ These models represent tradeable instruments and data provider configuration.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from liq.core._types import DecimalStr
+from liq.core._validators import require_aware
 from liq.core.enums import AssetClass
 
 
@@ -48,16 +49,11 @@ class Instrument(BaseModel):
     name: str
     base_currency: str
     quote_currency: str
-    tick_size: Decimal = Field(gt=0)
-    lot_size: Decimal = Field(gt=0)
+    tick_size: DecimalStr = Field(gt=0)
+    lot_size: DecimalStr = Field(gt=0)
     active: bool
     trading_hours: dict[str, Any] | None = None
 
-    @field_serializer("tick_size", "lot_size")
-    def serialize_decimal(self, v: Decimal) -> str:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v)
-
 
 class ProviderMetadata(BaseModel):
     """Metadata about a data provider.
@@ -98,12 +94,6 @@ class ProviderMetadata(BaseModel):
     historical_data_limit_years: int | None = None
     last_successful_fetch: datetime | None = None
 
-    @field_validator("last_successful_fetch")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime | None) -> datetime | None:
-        """Ensure timestamp is timezone-aware when provided."""
-        if v is not None and (v.tzinfo is None or v.tzinfo.utcoffset(v) is None):
-            raise ValueError(
-                "last_successful_fetch must be timezone-aware (UTC expected)"
-            )
-        return v
+    validate_timestamp_timezone = field_validator("last_successful_fetch")(
+        require_aware
+    )
@@ -2,75 +2,43 @@
 
 from datetime import datetime
 
-from pydantic import (
-    BaseModel,
-    ConfigDict,
-    Field,
-    ValidationInfo,
-    field_validator,
-    model_validator,
-)
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
+from liq.core._validators import require_aware
 from liq.core.cash_movement import CashMovement
 from liq.core.corporate_action import CorporateAction
+from liq.core.enums import EntryType
 from liq.core.fill import Fill
 from liq.core.portfolio import PortfolioState
 
+# Payload field each entry type must carry. Margin calls carry no payload.
+_REQUIRED_PAYLOAD = {
+    EntryType.FILL: "fill",
+    EntryType.CASH: "cash_movement",
+    EntryType.CORPORATE_ACTION: "corporate_action",
+}
+
 
 class LedgerEntry(BaseModel):
     """Single ledger entry for analytics."""
 
-    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+    model_config = ConfigDict(frozen=True)
 
     timestamp: datetime
-    entry_type: str = Field(pattern="^(fill|cash|corporate_action|margin_call)$")
+    entry_type: EntryType
     fill: Fill | None = None
     cash_movement: CashMovement | None = None
     corporate_action: CorporateAction | None = None
     portfolio_state_after: PortfolioState | None = None
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
-
-    @field_validator("fill", "cash_movement", "corporate_action")
-    @classmethod
-    def validate_conditionals(
-        cls,
-        v: Fill | CashMovement | CorporateAction | None,
-        info: ValidationInfo,
-    ) -> Fill | CashMovement | CorporateAction | None:
-        entry_type = info.data.get("entry_type")
-        if entry_type == "fill" and info.field_name == "fill" and v is None:
-            raise ValueError("fill is required when entry_type is fill")
-        if entry_type == "cash" and info.field_name == "cash_movement" and v is None:
-            raise ValueError("cash_movement is required when entry_type is cash")
-        if (
-            entry_type == "corporate_action"
-            and info.field_name == "corporate_action"
-            and v is None
-        ):
-            raise ValueError(
-                "corporate_action is required when entry_type is corporate_action"
-            )
-        return v
-
-    @field_validator("entry_type")
-    @classmethod
-    def validate_entry_type(cls, v: str) -> str:
-        return v
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
 
     @model_validator(mode="after")
     def validate_required_payloads(self) -> "LedgerEntry":
-        if self.entry_type == "fill" and self.fill is None:
-            raise ValueError("fill is required when entry_type is fill")
-        if self.entry_type == "cash" and self.cash_movement is None:
-            raise ValueError("cash_movement is required when entry_type is cash")
-        if self.entry_type == "corporate_action" and self.corporate_action is None:
+        """Require the payload field that matches entry_type."""
+        field = _REQUIRED_PAYLOAD.get(self.entry_type)
+        if field is not None and getattr(self, field) is None:
             raise ValueError(
-                "corporate_action is required when entry_type is corporate_action"
+                f"{field} is required when entry_type is {self.entry_type.value}"
             )
         return self
@@ -6,20 +6,23 @@ It captures all parameters needed to submit an order to a broker.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID, uuid4
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
-    field_serializer,
+    ValidationInfo,
     field_validator,
     model_validator,
 )
 
+from liq.core._types import AsString, DecimalStr
+from liq.core._validators import canonical_symbol, require_aware
 from liq.core.enums import OrderSide, OrderType, TimeInForce
-from liq.core.symbols import validate_symbol
+
+_ZERO = Decimal(0)
 
 
 class OrderRequest(BaseModel):
@@ -48,120 +51,100 @@ class OrderRequest(BaseModel):
 
     model_config = ConfigDict(
         frozen=True,
-        str_strip_whitespace=True,
     )
 
     client_order_id: UUID = Field(default_factory=uuid4)
     external_client_order_id: str | None = None
     symbol: str
-    side: OrderSide
-    order_type: OrderType
-    quantity: Decimal
-    limit_price: Decimal | None = None
-    stop_price: Decimal | None = None
-    time_in_force: TimeInForce = TimeInForce.DAY
+    side: Annotated[OrderSide, AsString]
+    order_type: Annotated[OrderType, AsString]
+    quantity: DecimalStr
+    limit_price: DecimalStr | None = None
+    stop_price: DecimalStr | None = None
+    time_in_force: Annotated[TimeInForce, AsString] = TimeInForce.DAY
     timestamp: datetime
     policy_id: str | None = None
     confidence: float | None = None
     tags: dict[str, str] | None = None
     metadata: dict[str, Any] | None = None
 
+    validate_symbol_format = field_validator("symbol")(canonical_symbol)
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
+
     @field_validator("policy_id")
     @classmethod
     def validate_policy_id_non_empty(cls, v: str | None) -> str | None:
-        """Reject empty or whitespace-only policy_id when provided."""
-        if v is not None and not v.strip():
+        """Strip policy_id and ensure it is non-empty when provided."""
+        if v is None:
+            return v
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("policy_id must be non-empty when provided")
-        return v
+        return stripped
+
+    @field_validator("external_client_order_id")
+    @classmethod
+    def strip_external_client_order_id(cls, v: str | None) -> str | None:
+        """Strip surrounding whitespace from the external id."""
+        return v if v is None else v.strip()
 
-    @field_validator("symbol")
+    @field_validator("tags")
     @classmethod
-    def validate_symbol_format(cls, v: str) -> str:
-        """Normalize and validate symbol format."""
-        normalized = v.strip().upper()
-        if not validate_symbol(normalized):
-            raise ValueError("symbol must be canonical (uppercase with _ or -)")
-        return normalized
-
-    @field_validator("timestamp")
+    def strip_tags(cls, v: dict[str, str] | None) -> dict[str, str] | None:
+        """Strip surrounding whitespace from tag keys and values."""
+        if v is None:
+            return v
+        return {key.strip(): value.strip() for key, value in v.items()}
+
+    @field_validator("metadata")
     @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp is timezone-aware."""
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
+    def strip_metadata_keys(cls, v: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Strip surrounding whitespace from metadata keys; values are kept as-is."""
+        if v is None:
+            return v
+        return {key.strip(): value for key, value in v.items()}
 
     @field_validator("quantity")
     @classmethod
     def validate_quantity_positive(cls, v: Decimal) -> Decimal:
         """Ensure quantity is positive."""
-        if v <= 0:
+        if v <= _ZERO:
             raise ValueError("quantity must be > 0")
         return v
 
-    @field_validator("limit_price")
-    @classmethod
-    def validate_limit_price_positive(cls, v: Decimal | None) -> Decimal | None:
-        """Ensure limit_price is positive when provided."""
-        if v is not None and v <= 0:
-            raise ValueError("limit_price must be > 0")
-        return v
-
-    @field_validator("stop_price")
+    @field_validator("limit_price", "stop_price")
     @classmethod
-    def validate_stop_price_positive(cls, v: Decimal | None) -> Decimal | None:
-        """Ensure stop_price is positive when provided."""
-        if v is not None and v <= 0:
-            raise ValueError("stop_price must be > 0")
+    def validate_price_positive(
+        cls, v: Decimal | None, info: ValidationInfo
+    ) -> Decimal | None:
+        """Ensure limit and stop prices are positive when provided."""
+        if v is not None and v <= _ZERO:
+            raise ValueError(f"{info.field_name} must be > 0")
         return v
 
     @field_validator("confidence")
     @classmethod
     def validate_confidence_range(cls, v: float | None) -> float | None:
         """Ensure confidence is within [0, 1] when provided."""
-        if v is None:
-            return v
-        if not 0.0 <= v <= 1.0:
+        if v is not None and not 0.0 <= v <= 1.0:
             raise ValueError("confidence must be between 0.0 and 1.0")
         return v
 
     @model_validator(mode="after")
     def validate_price_requirements(self) -> "OrderRequest":
-        """Validate that required prices are present based on order type."""
-        if self.order_type == OrderType.LIMIT:
-            if self.limit_price is None:
+        """Ensure each order type carries the prices it needs."""
+        limit_price = self.limit_price
+        stop_price = self.stop_price
+        order_type = self.order_type
+        if order_type is OrderType.LIMIT:
+            if limit_price is None:
                 raise ValueError("limit_price is required for LIMIT orders")
-        elif self.order_type == OrderType.STOP:
-            if self.stop_price is None:
+        elif order_type is OrderType.STOP:
+            if stop_price is None:
                 raise ValueError("stop_price is required for STOP orders")
-        elif self.order_type == OrderType.STOP_LIMIT:
-            if self.limit_price is None:
+        elif order_type is OrderType.STOP_LIMIT:
+            if limit_price is None:
                 raise ValueError("limit_price is required for STOP_LIMIT orders")
-            if self.stop_price is None:
+            if stop_price is None:
                 raise ValueError("stop_price is required for STOP_LIMIT orders")
         return self
-
-    @field_serializer("quantity", "limit_price", "stop_price")
-    def serialize_decimal(self, v: Decimal | None) -> str | None:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v) if v is not None else None
-
-    @field_serializer("external_client_order_id")
-    def serialize_external_id(self, v: str | None) -> str | None:
-        """Serialize external client id."""
-        return v
-
-    @field_serializer("side")
-    def serialize_side(self, v: OrderSide) -> str:
-        """Serialize OrderSide as string."""
-        return str(v)
-
-    @field_serializer("order_type")
-    def serialize_order_type(self, v: OrderType) -> str:
-        """Serialize OrderType as string."""
-        return str(v)
-
-    @field_serializer("time_in_force")
-    def serialize_time_in_force(self, v: TimeInForce) -> str:
-        """Serialize TimeInForce as string."""
-        return str(v)
@@ -7,12 +7,16 @@ at a point in time, including cash and all positions.
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from liq.core._types import DecimalStr
+from liq.core._validators import canonical_symbol, require_aware
 from liq.core.enums import Currency
 from liq.core.order import OrderRequest
 from liq.core.position import Position
-from liq.core.symbols import validate_symbol
+
+# Shared additive identity for the aggregate loops (Decimal is immutable)
+_ZERO = Decimal(0)
 
 
 class PortfolioState(BaseModel):
@@ -40,15 +44,14 @@ class PortfolioState(BaseModel):
 
     model_config = ConfigDict(
         frozen=True,
-        str_strip_whitespace=True,
     )
 
-    cash: Decimal
-    unsettled_cash: Decimal = Decimal("0")
+    cash: DecimalStr
+    unsettled_cash: DecimalStr = Decimal("0")
     positions: dict[str, Position]
-    realized_pnl: Decimal = Decimal("0")
-    buying_power: Decimal | None = None
-    margin_used: Decimal | None = None
+    realized_pnl: DecimalStr = Decimal("0")
+    buying_power: DecimalStr | None = None
+    margin_used: DecimalStr | None = None
     day_trades_remaining: int | None = None
     pending_orders: list[OrderRequest] = Field(default_factory=list)
     currency: Currency = Currency.USD
@@ -63,27 +66,21 @@ class PortfolioState(BaseModel):
 
         normalized: dict[str, Position] = {}
         for symbol, position in v.items():
-            normalized_symbol = symbol.strip().upper()
-            if not validate_symbol(normalized_symbol):
-                raise ValueError("position symbol keys must be canonical")
-            normalized[normalized_symbol] = position
+            try:
+                normalized[canonical_symbol(symbol)] = position
+            except ValueError:
+                raise ValueError("position symbol keys must be canonical") from None
         return normalized
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp is timezone-aware."""
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
 
     @property
     def total_market_value(self) -> Decimal:
         """Calculate total market value of all positions."""
-        return sum(
-            (pos.market_value for pos in self.positions.values()),
-            Decimal("0"),
-        )
+        total = _ZERO
+        for position in self.positions.values():
+            total += position.market_value
+        return total
 
     @property
     def equity(self) -> Decimal:
@@ -98,7 +95,7 @@ class PortfolioState(BaseModel):
     @property
     def symbols(self) -> list[str]:
         """Return list of symbols with positions."""
-        return list(self.positions.keys())
+        return list(self.positions)
 
     def get_position(self, symbol: str) -> Position | None:
         """Get position for symbol.
@@ -123,20 +120,9 @@ class PortfolioState(BaseModel):
         Raises:
             KeyError: If price missing for any position
         """
-        total = Decimal("0")
+        total = _ZERO
         for symbol, position in self.positions.items():
-            current_price = current_prices[symbol]
-            total += position.unrealized_pnl(current_price)
+            total += (
+                current_prices[symbol] - position.average_price
+            ) * position.quantity
         return total
-
-    @field_serializer(
-        "cash", "unsettled_cash", "realized_pnl", "buying_power", "margin_used"
-    )
-    def serialize_decimal(self, v: Decimal | None) -> str | None:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v) if v is not None else None
-
-    @field_serializer("pending_orders")
-    def serialize_orders(self, v: list[OrderRequest]) -> list[dict]:
-        """Serialize pending orders as dicts."""
-        return [order.model_dump() for order in v]
@@ -5,20 +5,22 @@ The Position model represents a holding in a single instrument.
 
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
+from typing import Any
 
-from pydantic import (
-    BaseModel,
-    ConfigDict,
-    ValidationInfo,
-    field_serializer,
-    field_validator,
-)
+from pydantic import ConfigDict, ValidationInfo, field_validator, model_validator
 
+from liq.core._base import CachedPropertyModel
+from liq.core._construct import construct_trusted, field_defaults
+from liq.core._types import DecimalStr
+from liq.core._validators import canonical_symbol, require_aware
 from liq.core.enums import AssetClass
-from liq.core.symbols import validate_symbol
 
+# Decimal-to-Decimal comparison skips the int conversion of a literal 0
+_ZERO = Decimal(0)
 
-class Position(BaseModel):
+
+class Position(CachedPropertyModel):
     """Position representing a holding in a single instrument.
 
     Attributes:
@@ -32,7 +34,7 @@ class Position(BaseModel):
         is_long: quantity > 0
         is_short: quantity < 0
         is_flat: quantity == 0
-        market_value: abs(quantity) * average_price
+        market_value: quantity * mark price (cached)
 
     Methods:
         unrealized_pnl(current_price): (current_price - average_price) * quantity
@@ -44,77 +46,70 @@ class Position(BaseModel):
 
     model_config = ConfigDict(
         frozen=True,
-        str_strip_whitespace=True,
+        extra="forbid",
     )
 
     symbol: str
-    quantity: Decimal
-    average_price: Decimal
-    realized_pnl: Decimal
+    quantity: DecimalStr
+    average_price: DecimalStr
+    realized_pnl: DecimalStr
     timestamp: datetime
-    current_price: Decimal | None = None
+    current_price: DecimalStr | None = None
     asset_class: AssetClass | None = None
     avg_entry_price: Decimal | None = None
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol_format(cls, v: str) -> str:
-        """Normalize and validate symbol format."""
-        normalized = v.strip().upper()
-        if not validate_symbol(normalized):
-            raise ValueError("symbol must be canonical (uppercase with _ or -)")
-        return normalized
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp is timezone-aware."""
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
+    validate_symbol_format = field_validator("symbol")(canonical_symbol)
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
 
-    @field_validator("average_price")
+    @field_validator("average_price", "current_price", "avg_entry_price")
     @classmethod
-    def validate_average_price_non_negative(cls, v: Decimal) -> Decimal:
-        """Ensure average_price is non-negative."""
-        if v < 0:
-            raise ValueError("average_price must be >= 0")
+    def validate_price_non_negative(
+        cls, v: Decimal | None, info: ValidationInfo
+    ) -> Decimal | None:
+        """Ensure average, current, and entry prices are non-negative."""
+        if v is not None and v < _ZERO:
+            raise ValueError(f"{info.field_name} must be >= 0")
         return v
 
-    @field_validator("current_price")
-    @classmethod
-    def validate_current_price_non_negative(cls, v: Decimal | None) -> Decimal | None:
-        """Ensure current_price is non-negative when provided."""
-        if v is not None and v < 0:
-            raise ValueError("current_price must be >= 0")
-        return v
+    @model_validator(mode="after")
+    def apply_avg_entry_price(self) -> "Position":
+        """Let a provided ``avg_entry_price`` take precedence over ``average_price``."""
+        avg_entry_price = self.avg_entry_price
+        if avg_entry_price is not None and avg_entry_price != self.average_price:
+            object.__setattr__(self, "average_price", avg_entry_price)
+        return self
 
-    @field_validator("avg_entry_price")
     @classmethod
-    def sync_avg_entry_price(
-        cls,
-        v: Decimal | None,
-        info: ValidationInfo,
-    ) -> Decimal | None:
-        """Mirror avg_entry_price with average_price when provided."""
-        return v if v is not None else info.data.get("average_price")
+    def construct_unchecked(cls, **values: Any) -> "Position":
+        """Build a position from trusted values without validation.
+
+        For internal producers (backtest replay, broker adapters) whose data
+        was validated upstream. No checks or coercion run: the caller
+        guarantees symbol is canonical, timestamp is timezone-aware,
+        and quantity, average_price, and realized_pnl are ``Decimal`` values
+        with average_price (and current_price, if given) non-negative.
+        Omitted optional fields take their defaults.
+        """
+        return construct_trusted(
+            cls, {**field_defaults(cls), **values}, fields_set=values
+        )
 
     @property
     def is_long(self) -> bool:
         """Check if position is long (positive quantity)."""
-        return self.quantity > 0
+        return self.quantity > _ZERO
 
     @property
     def is_short(self) -> bool:
         """Check if position is short (negative quantity)."""
-        return self.quantity < 0
+        return self.quantity < _ZERO
 
     @property
     def is_flat(self) -> bool:
         """Check if position is flat (zero quantity)."""
-        return self.quantity == 0
+        return self.quantity == _ZERO
 
-    @property
+    @cached_property
     def market_value(self) -> Decimal:
         """Calculate signed market value: quantity * mark price."""
         mark_price = (
@@ -137,11 +132,6 @@ class Position(BaseModel):
         """
         return (current_price - self.average_price) * self.quantity
 
-    @field_serializer("quantity", "average_price", "realized_pnl", "current_price")
-    def serialize_decimal(self, v: Decimal | None) -> str | None:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v) if v is not None else None
-
     @property
     def avg_entry(self) -> Decimal:
         """Expose avg_entry_price alias."""
@@ -150,12 +140,3 @@ class Position(BaseModel):
             if self.avg_entry_price is not None
             else self.average_price
         )
-
-    @classmethod
-    def model_validate(cls, *args, **kwargs):
-        obj = super().model_validate(*args, **kwargs)
-        if obj.avg_entry_price is not None and obj.average_price != obj.avg_entry_price:
-            object.__setattr__(obj, "average_price", obj.avg_entry_price)
-        elif obj.avg_entry_price is None:
-            object.__setattr__(obj, "avg_entry_price", obj.average_price)
-        return obj
@@ -6,19 +6,41 @@ bid and ask prices for an instrument.
 
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
+from typing import Any
 
 from pydantic import (
-    BaseModel,
     ConfigDict,
-    field_serializer,
+    ValidationInfo,
     field_validator,
     model_validator,
 )
 
-from liq.core.symbols import validate_symbol
+from liq.core._base import CachedPropertyModel
+from liq.core._construct import construct_trusted, field_defaults
+from liq.core._types import DecimalStr
+from liq.core._validators import canonical_symbol, require_aware
 
+_ZERO = Decimal(0)
 
-class Quote(BaseModel):
+
+def _check_quote(
+    bid: Decimal, ask: Decimal, bid_size: Decimal, ask_size: Decimal
+) -> None:
+    """Raise ValueError unless prices are positive, sizes non-negative, ask >= bid."""
+    if bid <= _ZERO:
+        raise ValueError("bid must be > 0")
+    if ask <= _ZERO:
+        raise ValueError("ask must be > 0")
+    if bid_size < _ZERO:
+        raise ValueError("bid_size must be >= 0")
+    if ask_size < _ZERO:
+        raise ValueError("ask_size must be >= 0")
+    if ask < bid:
+        raise ValueError("ask must be >= bid")
+
+
+class Quote(CachedPropertyModel):
     """Best bid/ask snapshot for an instrument.
 
     Attributes:
@@ -29,7 +51,7 @@ class Quote(BaseModel):
         bid_size: Size available at bid
         ask_size: Size available at ask
 
-    Computed Properties:
+    Computed Properties (cached):
         mid: (bid + ask) / 2
         spread: ask - bid
         spread_bps: (spread / mid) * 10000
@@ -37,74 +59,70 @@ class Quote(BaseModel):
 
     model_config = ConfigDict(
         frozen=True,
-        str_strip_whitespace=True,
+        extra="forbid",
     )
 
     symbol: str
     timestamp: datetime
-    bid: Decimal
-    ask: Decimal
-    bid_size: Decimal
-    ask_size: Decimal
+    bid: DecimalStr
+    ask: DecimalStr
+    bid_size: DecimalStr
+    ask_size: DecimalStr
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol_format(cls, v: str) -> str:
-        """Normalize and validate symbol format."""
-        normalized = v.strip().upper()
-        if not validate_symbol(normalized):
-            raise ValueError("symbol must be canonical (uppercase with _ or -)")
-        return normalized
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp is timezone-aware."""
-        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
-            raise ValueError("timestamp must be timezone-aware (UTC expected)")
-        return v
+    validate_symbol_format = field_validator("symbol")(canonical_symbol)
+    validate_timestamp_timezone = field_validator("timestamp")(require_aware)
 
     @field_validator("bid", "ask")
     @classmethod
-    def validate_price_positive(cls, v: Decimal) -> Decimal:
-        """Ensure bid/ask prices are positive."""
-        if v <= 0:
-            raise ValueError("bid/ask must be > 0")
+    def validate_price_positive(cls, v: Decimal, info: ValidationInfo) -> Decimal:
+        """Ensure bid and ask are positive."""
+        if v <= _ZERO:
+            raise ValueError(f"{info.field_name} must be > 0")
         return v
 
     @field_validator("bid_size", "ask_size")
     @classmethod
-    def validate_size_non_negative(cls, v: Decimal) -> Decimal:
+    def validate_size_non_negative(cls, v: Decimal, info: ValidationInfo) -> Decimal:
         """Ensure sizes are non-negative."""
-        if v < 0:
-            raise ValueError("size must be >= 0")
+        if v < _ZERO:
+            raise ValueError(f"{info.field_name} must be >= 0")
         return v
 
     @model_validator(mode="after")
     def validate_spread(self) -> "Quote":
-        """Ensure market is not crossed."""
+        """Ensure ask is not below bid."""
         if self.ask < self.bid:
             raise ValueError("ask must be >= bid")
         return self
 
-    @property
+    @classmethod
+    def construct_unchecked(cls, **values: Any) -> "Quote":
+        """Build a quote from trusted values without validation.
+
+        For internal producers (backtest replay, broker adapters) whose data
+        was validated upstream. No checks or coercion run: the caller
+        guarantees symbol is canonical, timestamp is timezone-aware,
+        bid and ask are positive ``Decimal`` values with ask >= bid, and sizes
+        are non-negative ``Decimal`` values.
+        Omitted optional fields take their defaults.
+        """
+        return construct_trusted(
+            cls, {**field_defaults(cls), **values}, fields_set=values
+        )
+
+    @cached_property
     def mid(self) -> Decimal:
         """Calculate mid price: (bid + ask) / 2."""
         return (self.bid + self.ask) / 2
 
-    @property
+    @cached_property
     def spread(self) -> Decimal:
         """Calculate spread: ask - bid."""
         return self.ask - self.bid
 
-    @property
+    @cached_property
     def spread_bps(self) -> Decimal:
         """Calculate spread in basis points: (spread / mid) * 10000."""
         if self.mid == 0:
             return Decimal("0")
         return (self.spread / self.mid) * 10000
-
-    @field_serializer("bid", "ask", "bid_size", "ask_size")
-    def serialize_decimal(self, v: Decimal) -> str:
-        """Serialize Decimal as string to preserve precision."""
-        return str(v)
@@ -0,0 +1,157 @@
+"""Columnar quote storage for the LIQ Stack.
+
+A QuoteBatch holds a quote stream as parallel column tuples instead of one
+``Quote`` model per tick, so feed ingestion and mid/spread aggregates avoid
+building a model instance for every tick. ``Quote`` remains the single-quote
+API: rows are materialized on demand with ``QuoteBatch.row``.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from liq.core._construct import construct_trusted
+from liq.core._validators import check_aware, validate_columns
+from liq.core.quote import Quote, _check_quote
+
+_ZERO = Decimal(0)
+_BPS = Decimal(10000)
+
+
+def _check_row(
+    timestamp: datetime,
+    bid: Decimal,
+    ask: Decimal,
+    bid_size: Decimal,
+    ask_size: Decimal,
+) -> None:
+    """Raise ValueError unless one columnar quote row is valid."""
+    check_aware(timestamp, "timestamp")
+    _check_quote(bid, ask, bid_size, ask_size)
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteBatch:
+    """Validated quote stream stored column by column.
+
+    Build instances with ``from_columns`` or ``from_quotes`` so rows are
+    validated; the columns are then trusted when rows are materialized.
+
+    Attributes:
+        timestamps: Quote times (UTC, timezone-aware)
+        symbols: Canonical symbol per row (repeated values share one string)
+        bids: Best bid prices
+        asks: Best ask prices
+        bid_sizes: Sizes available at bid
+        ask_sizes: Sizes available at ask
+
+    Example:
+        batch = QuoteBatch.from_columns(ts, "EUR_USD", bids, asks, bsz, asz)
+        mids = batch.mids()
+        last = batch.row(-1)
+    """
+
+    timestamps: tuple[datetime, ...]
+    symbols: tuple[str, ...]
+    bids: tuple[Decimal, ...]
+    asks: tuple[Decimal, ...]
+    bid_sizes: tuple[Decimal, ...]
+    ask_sizes: tuple[Decimal, ...]
+
+    @classmethod
+    def from_columns(
+        cls,
+        timestamps: Sequence[datetime],
+        symbol: str | Sequence[str],
+        bids: Sequence[Decimal],
+        asks: Sequence[Decimal],
+        bid_sizes: Sequence[Decimal],
+        ask_sizes: Sequence[Decimal],
+    ) -> "QuoteBatch":
+        """Validate column sequences and store them as a batch.
+
+        Applies the same checks as ``Quote`` construction. Price and size
+        values must already be ``Decimal``.
+
+        Args:
+            timestamps: Quote times (UTC, timezone-aware)
+            symbol: One symbol for every row, or one symbol per row
+            bids: Best bid prices
+            asks: Best ask prices
+            bid_sizes: Sizes available at bid
+            ask_sizes: Sizes available at ask
+
+        Returns:
+            Validated batch
+
+        Raises:
+            ValueError: If column lengths differ or a row fails validation
+                (the message includes the row index)
+        """
+        symbols = validate_columns(
+            timestamps, symbol, (bids, asks, bid_sizes, ask_sizes), _check_row
+        )
+        return cls(
+            tuple(timestamps),
+            tuple(symbols),
+            tuple(bids),
+            tuple(asks),
+            tuple(bid_sizes),
+            tuple(ask_sizes),
+        )
+
+    @classmethod
+    def from_quotes(cls, quotes: Sequence[Quote]) -> "QuoteBatch":
+        """Collect already-validated quotes into a batch."""
+        return cls(
+            tuple(q.timestamp for q in quotes),
+            tuple(q.symbol for q in quotes),
+            tuple(q.bid for q in quotes),
+            tuple(q.ask for q in quotes),
+            tuple(q.bid_size for q in quotes),
+            tuple(q.ask_size for q in quotes),
+        )
+
+    def __len__(self) -> int:
+        """Number of quotes in the batch."""
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[Quote]:
+        """Iterate over rows as Quote models."""
+        for i in range(len(self.timestamps)):
+            yield self.row(i)
+
+    def row(self, i: int) -> Quote:
+        """Materialize row ``i`` as a Quote without re-validating it."""
+        return construct_trusted(
+            Quote,
+            {
+                "symbol": self.symbols[i],
+                "timestamp": self.timestamps[i],
+                "bid": self.bids[i],
+                "ask": self.asks[i],
+                "bid_size": self.bid_sizes[i],
+                "ask_size": self.ask_sizes[i],
+            },
+        )
+
+    def to_quotes(self) -> list[Quote]:
+        """Materialize every row as a Quote."""
+        return [self.row(i) for i in range(len(self.timestamps))]
+
+    def mids(self) -> list[Decimal]:
+        """Mid price per row: (bid + ask) / 2, matching ``Quote.mid``."""
+        return [(bid + ask) / 2 for bid, ask in zip(self.bids, self.asks, strict=True)]
+
+    def spreads(self) -> list[Decimal]:
+        """Spread per row: ask - bid, matching ``Quote.spread``."""
+        return [ask - bid for bid, ask in zip(self.bids, self.asks, strict=True)]
+
+    def spreads_bps(self) -> list[Decimal]:
+        """Spread in basis points per row, matching ``Quote.spread_bps``."""
+        out: list[Decimal] = []
+        for bid, ask in zip(self.bids, self.asks, strict=True):
+            mid = (bid + ask) / 2
+            out.append((ask - bid) / mid * _BPS if mid else _ZERO)
+        return out
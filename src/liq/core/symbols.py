@@ -4,20 +4,45 @@ Provides functions to normalize, parse, and validate trading symbols
 across different asset classes and providers.
 """
 
-import re
+import sys
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 
 from liq.core.enums import AssetClass
 
-# Known quote currencies for crypto parsing (ordered by length, longest first)
-_CRYPTO_QUOTES = ["USDT", "USDC", "BUSD", "USD", "BTC", "ETH", "EUR", "GBP"]
-
-# Regex pattern for valid normalized symbols
-_VALID_SYMBOL_PATTERN = re.compile(r"^[A-Z0-9][A-Z0-9_-]{0,18}[A-Z0-9]$|^[A-Z0-9]{2}$")
-
-
+# Known quote currencies for crypto parsing (sorted by length, longest first)
+_CRYPTO_QUOTES: tuple[str, ...] = tuple(
+    sorted(
+        ("USDT", "USDC", "BUSD", "USD", "BTC", "ETH", "EUR", "GBP"),
+        key=len,
+        reverse=True,
+    )
+)
+
+# Quote currencies grouped by length, longest first: detection slices the
+# symbol suffix once per length and probes a set, instead of calling
+# endswith() for every known quote
+_CRYPTO_QUOTES_BY_LENGTH = tuple(
+    (n, frozenset(q for q in _CRYPTO_QUOTES if len(q) == n))
+    for n in dict.fromkeys(len(q) for q in _CRYPTO_QUOTES)
+)
+
+# Characters allowed in normalized symbols: the first and last characters
+# must be A-Z or 0-9; inner characters may also be "_" or "-"
+_EDGE_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+_SYMBOL_CHARS = _EDGE_CHARS | {"_", "-"}
+
+# Symbol universes are small and heavily repeated, so results are memoized
+_SYMBOL_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def normalize_symbol(symbol: str, asset_class: AssetClass) -> str:
     """Normalize a symbol to canonical format.
 
+    Results are memoized per (symbol, asset_class) and interned, so every
+    raw spelling of a symbol normalizes to one shared string object.
+
     Args:
         symbol: Raw symbol string from any provider
         asset_class: Type of asset (FOREX, CRYPTO, EQUITY)
@@ -39,17 +64,37 @@ def normalize_symbol(symbol: str, asset_class: AssetClass) -> str:
     # Strip whitespace and uppercase
     symbol = symbol.strip().upper()
 
-    # Remove exchange prefix (e.g., "BINANCE:BTCUSDT" -> "BTCUSDT")
-    if ":" in symbol:
-        symbol = symbol.split(":")[-1]
+    # Remove exchange prefix (e.g., "BINANCE:BTCUSDT" -> "BTCUSDT"); keeps
+    # the text after the last ":" and returns the symbol unchanged if absent
+    symbol = symbol.rpartition(":")[2]
 
-    if asset_class == AssetClass.FOREX:
-        return _normalize_forex(symbol)
-    elif asset_class == AssetClass.CRYPTO:
-        return _normalize_crypto(symbol)
-    else:
-        # Equity and others: just uppercase ticker
-        return symbol
+    # Dispatch by asset class; equity and others keep the uppercase ticker
+    normalizer = _NORMALIZERS.get(asset_class)
+    if normalizer is not None:
+        symbol = normalizer(symbol)
+    return sys.intern(symbol)
+
+
+def normalize_symbols(symbols: Sequence[str], asset_class: AssetClass) -> list[str]:
+    """Normalize a column of symbols to canonical format.
+
+    Each distinct raw symbol is normalized once and the results are mapped
+    back over the column, so long columns with few distinct symbols avoid
+    a per-row ``normalize_symbol`` call.
+
+    Args:
+        symbols: Raw symbol strings from any provider
+        asset_class: Type of asset shared by every symbol
+
+    Returns:
+        Normalized symbols, in input order
+
+    Examples:
+        >>> normalize_symbols(["eur/usd", "EURUSD"], AssetClass.FOREX)
+        ['EUR_USD', 'EUR_USD']
+    """
+    normalized = {raw: normalize_symbol(raw, asset_class) for raw in set(symbols)}
+    return [normalized[raw] for raw in symbols]
 
 
 def _normalize_forex(symbol: str) -> str:
@@ -73,12 +118,11 @@ def _normalize_crypto(symbol: str) -> str:
     if "-" in symbol:
         return symbol
 
-    # Try to find quote currency and split
-    for quote in _CRYPTO_QUOTES:
-        if symbol.endswith(quote):
-            base = symbol[: -len(quote)]
-            if base:  # Ensure we have a base currency
-                return f"{base}-{quote}"
+    # Try to find quote currency and split (longest quote first, and only
+    # if a non-empty base currency remains)
+    for n, quotes in _CRYPTO_QUOTES_BY_LENGTH:
+        if len(symbol) > n and symbol[-n:] in quotes:
+            return f"{symbol[:-n]}-{symbol[-n:]}"
 
     # Fallback: assume 3-char base if symbol is 6+ chars
     if len(symbol) >= 6:
@@ -87,6 +131,13 @@ def _normalize_crypto(symbol: str) -> str:
     return symbol
 
 
+# Normalizers by asset class, looked up once per normalize_symbol call
+_NORMALIZERS: dict[AssetClass, Callable[[str], str]] = {
+    AssetClass.FOREX: _normalize_forex,
+    AssetClass.CRYPTO: _normalize_crypto,
+}
+
+
 def parse_symbol(canonical: str) -> tuple[str, str]:
     """Parse a canonical symbol into base and quote components.
 
@@ -104,15 +155,15 @@ def parse_symbol(canonical: str) -> tuple[str, str]:
         >>> parse_symbol("AAPL")
         ('AAPL', '')
     """
-    # Try underscore (forex)
+    # Try underscore (forex); partition returns a fixed tuple, no list
     if "_" in canonical:
-        parts = canonical.split("_", 1)
-        return (parts[0], parts[1])
+        base, _, quote = canonical.partition("_")
+        return (base, quote)
 
     # Try hyphen (crypto)
     if "-" in canonical:
-        parts = canonical.split("-", 1)
-        return (parts[0], parts[1])
+        base, _, quote = canonical.partition("-")
+        return (base, quote)
 
     # Equity or single asset
     return (canonical, "")
@@ -126,6 +177,9 @@ def validate_symbol(symbol: str) -> bool:
     - Are between 2-20 characters
     - Start and end with alphanumeric
 
+    Non-string input is rejected without raising. Results for strings are
+    memoized per symbol.
+
     Args:
         symbol: Symbol string to validate
 
@@ -140,10 +194,20 @@ def validate_symbol(symbol: str) -> bool:
         >>> validate_symbol("eur/usd")
         False
     """
-    if not symbol:
+    if not isinstance(symbol, str):
         return False
+    return _validate_symbol(symbol)
+
 
-    if len(symbol) < 2 or len(symbol) > 20:
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
+def _validate_symbol(symbol: str) -> bool:
+    """Memoized canonical-format check for a string symbol."""
+    if not 2 <= len(symbol) <= 20:
         return False
 
-    return bool(_VALID_SYMBOL_PATTERN.match(symbol))
+    # issuperset walks the string in C; no per-character bytecode runs
+    return (
+        symbol[0] in _EDGE_CHARS
+        and symbol[-1] in _EDGE_CHARS
+        and _SYMBOL_CHARS.issuperset(symbol)
+    )
@@ -1,9 +1,11 @@
 """Trade model representing a completed round-trip."""
 
 from decimal import Decimal
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from liq.core._construct import construct_trusted
 from liq.core.fill import Fill
 
 
@@ -18,3 +20,14 @@ class Trade(BaseModel):
     pnl: Decimal
     return_pct: Decimal
     holding_period: int = Field(gt=0)
+
+    @classmethod
+    def construct_unchecked(cls, **values: Any) -> "Trade":
+        """Build a trade from trusted values without validation.
+
+        For backtest engines that close many round trips from fills they
+        already hold. No checks or coercion run: the caller passes every
+        field, with validated ``Fill`` instances, ``Decimal`` pnl and
+        return_pct, and a positive holding_period.
+        """
+        return construct_trusted(cls, values)
@@ -4,23 +4,27 @@ Provides ValidationResult dataclass and helper functions for
 validating financial data types.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of validating a data model.
 
     Attributes:
         is_valid: True if all hard validations passed
-        errors: List of critical validation failures
-        warnings: List of non-critical issues (e.g., unusual values)
+        errors: Critical validation failures (default: none)
+        warnings: Non-critical issues, e.g. unusual values (default: none)
+
+    Omitted errors/warnings default to the shared empty tuple, so a plain
+    ``ValidationResult(is_valid=True)`` allocates no containers.
     """
 
     is_valid: bool
-    errors: list[str]
-    warnings: list[str]
+    errors: Sequence[str] = ()
+    warnings: Sequence[str] = ()
 
 
 def is_timezone_aware(dt: datetime) -> bool:
@@ -39,4 +43,5 @@ def is_timezone_aware(dt: datetime) -> bool:
         >>> is_timezone_aware(datetime.now())
         False
     """
-    return dt.tzinfo is not None and dt.tzinfo.utcoffset(dt) is not None
+    tz = dt.tzinfo
+    return tz is not None and tz.utcoffset(dt) is not None
@@ -1,10 +1,18 @@
 """Shared test fixtures for liq-core tests."""
 
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from typing import Any
+from uuid import uuid4
 
 import pytest
 
+from liq.core.fill import Fill
+from liq.core.instrument import Instrument, ProviderMetadata
+from liq.core.order import OrderRequest
+from liq.core.position import Position
+
 
 @pytest.fixture
 def utc_now() -> datetime:
@@ -12,9 +20,9 @@ def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_timestamp() -> datetime:
-    """Return a sample UTC timestamp for testing."""
+    """Return a sample UTC timestamp for testing (immutable, shared)."""
     return datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
 
 
@@ -28,3 +36,131 @@ def sample_ohlcv() -> dict[str, Decimal]:
         "close": Decimal("1.1025"),
         "volume": Decimal("10000"),
     }
+
+
+@pytest.fixture(scope="session")
+def bar_columns(sample_timestamp: datetime) -> Callable[..., dict[str, Any]]:
+    """Return a builder of ``n`` rising one-minute EUR_USD bar columns.
+
+    Each call returns fresh lists, so tests may edit a column to inject an
+    invalid row. The keys match ``Bar.from_arrays``/``BarFrame.from_columns``.
+    """
+
+    def build(n: int = 3) -> dict[str, Any]:
+        return {
+            "timestamps": [sample_timestamp + timedelta(minutes=i) for i in range(n)],
+            "symbol": "eur_usd",
+            "opens": [Decimal("1.10") + Decimal(i) / 100 for i in range(n)],
+            "highs": [Decimal("1.12") + Decimal(i) / 100 for i in range(n)],
+            "lows": [Decimal("1.09") + Decimal(i) / 100 for i in range(n)],
+            "closes": [Decimal("1.11") + Decimal(i) / 100 for i in range(n)],
+            "volumes": [Decimal("100")] * n,
+        }
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def quote_columns(sample_timestamp: datetime) -> Callable[..., dict[str, Any]]:
+    """Return a builder of ``n`` one-second EUR_USD quote columns.
+
+    Each call returns fresh lists; the keys match ``QuoteBatch.from_columns``.
+    """
+
+    def build(n: int = 3) -> dict[str, Any]:
+        return {
+            "timestamps": [sample_timestamp + timedelta(seconds=i) for i in range(n)],
+            "symbol": "eur_usd",
+            "bids": [Decimal("1.1000") + Decimal(i) / 10000 for i in range(n)],
+            "asks": [Decimal("1.1003") + Decimal(i) / 10000 for i in range(n)],
+            "bid_sizes": [Decimal("1000000")] * n,
+            "ask_sizes": [Decimal("500000")] * n,
+        }
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def canonical_fill(sample_timestamp: datetime) -> Fill:
+    """Return a validated EUR_USD buy fill shared across the session.
+
+    Fill is frozen, so tests that only read it share this instance and
+    build variants with ``model_copy(update=...)``.
+    """
+    return Fill(
+        fill_id=uuid4(),
+        client_order_id=uuid4(),
+        symbol="EUR_USD",
+        side="buy",
+        quantity=Decimal("10000"),
+        price=Decimal("1.1000"),
+        commission=Decimal("0.50"),
+        timestamp=sample_timestamp,
+    )
+
+
+@pytest.fixture(scope="session")
+def market_order(sample_timestamp: datetime) -> OrderRequest:
+    """Return a validated 10000 EUR_USD market buy order shared across the session."""
+    return OrderRequest(
+        symbol="EUR_USD",
+        side="buy",
+        order_type="market",
+        quantity=Decimal("10000"),
+        timestamp=sample_timestamp,
+    )
+
+
+@pytest.fixture(scope="session")
+def eur_position(sample_timestamp: datetime) -> Position:
+    """Return a validated 10000 EUR_USD @ 1.1000 position shared across the session."""
+    return Position(
+        symbol="EUR_USD",
+        quantity=Decimal("10000"),
+        average_price=Decimal("1.1000"),
+        realized_pnl=Decimal("0"),
+        timestamp=sample_timestamp,
+    )
+
+
+@pytest.fixture(scope="session")
+def btc_position(sample_timestamp: datetime) -> Position:
+    """Return a validated 0.5 BTC-USD @ 50000 position shared across the session."""
+    return Position(
+        symbol="BTC-USD",
+        quantity=Decimal("0.5"),
+        average_price=Decimal("50000"),
+        realized_pnl=Decimal("0"),
+        timestamp=sample_timestamp,
+    )
+
+
+@pytest.fixture(scope="session")
+def canonical_instrument() -> Instrument:
+    """Return a validated EUR/USD forex instrument shared across the session."""
+    return Instrument(
+        symbol="EUR/USD",
+        provider="oanda",
+        canonical_symbol="EUR_USD",
+        asset_class="forex",
+        name="Euro vs US Dollar",
+        base_currency="EUR",
+        quote_currency="USD",
+        tick_size=Decimal("0.00001"),
+        lot_size=Decimal("1000"),
+        active=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def canonical_provider() -> ProviderMetadata:
+    """Return validated forex provider metadata shared across the session."""
+    return ProviderMetadata(
+        provider_name="test",
+        asset_classes=["forex"],
+        api_endpoint="https://api.test.com",
+        rate_limit_per_minute=60,
+        enabled=True,
+        priority=1,
+        authentication_required=True,
+    )
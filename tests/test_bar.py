@@ -1,6 +1,6 @@
 """Tests for liq.core.bar module."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
@@ -206,6 +206,32 @@ class TestBarTimezoneValidation:
         )
         assert bar.timestamp.tzinfo is not None
 
+    def test_rejects_non_utc_offset(self) -> None:
+        with pytest.raises(ValidationError, match="timestamp must be UTC"):
+            Bar(
+                timestamp=datetime(
+                    2024, 1, 15, 10, 30, tzinfo=timezone(timedelta(hours=2))
+                ),
+                symbol="EUR_USD",
+                open=Decimal("1.1000"),
+                high=Decimal("1.1050"),
+                low=Decimal("1.0950"),
+                close=Decimal("1.1025"),
+                volume=Decimal("10000"),
+            )
+
+    def test_accepts_zero_offset_timezone(self) -> None:
+        bar = Bar(
+            timestamp=datetime(2024, 1, 15, 10, 30, tzinfo=timezone(timedelta(0))),
+            symbol="EUR_USD",
+            open=Decimal("1.1000"),
+            high=Decimal("1.1050"),
+            low=Decimal("1.0950"),
+            close=Decimal("1.1025"),
+            volume=Decimal("10000"),
+        )
+        assert bar.timestamp.utcoffset() == timedelta(0)
+
     def test_rejects_invalid_symbol(self, sample_timestamp: datetime) -> None:
         with pytest.raises(ValidationError):
             Bar(
@@ -218,6 +244,26 @@ class TestBarTimezoneValidation:
                 volume=Decimal("10000"),
             )
 
+    def test_reports_each_invalid_field(self) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            Bar(
+                timestamp=datetime(2024, 1, 15, 10, 30),
+                symbol="eur/usd",
+                open=Decimal("0"),
+                high=Decimal("1.1050"),
+                low=Decimal("1.0950"),
+                close=Decimal("1.1025"),
+                volume=Decimal("-1"),
+            )
+        errors = exc_info.value.errors()
+        assert exc_info.value.error_count() == 4
+        assert [e["loc"] for e in errors] == [
+            ("timestamp",),
+            ("symbol",),
+            ("open",),
+            ("volume",),
+        ]
+
 
 class TestBarDerivedFields:
     """Tests for computed derived fields."""
@@ -260,6 +306,39 @@ class TestBarDerivedFields:
         assert bar.midrange == Decimal("1.1000")
         assert bar.range == Decimal("0")
 
+    def test_derived_fields_are_cached(self, sample_timestamp: datetime) -> None:
+        bar = Bar(
+            timestamp=sample_timestamp,
+            symbol="EUR_USD",
+            open=Decimal("1.1000"),
+            high=Decimal("1.1050"),
+            low=Decimal("1.0950"),
+            close=Decimal("1.1025"),
+            volume=Decimal("10000"),
+        )
+        assert bar.midrange is bar.midrange
+        assert bar.range is bar.range
+        assert bar.model_dump()["high"] == "1.1050"
+        assert "midrange" not in bar.model_dump()
+
+    def test_model_copy_recomputes_derived_fields(
+        self, sample_timestamp: datetime
+    ) -> None:
+        bar = Bar(
+            timestamp=sample_timestamp,
+            symbol="EUR_USD",
+            open=Decimal("1.1000"),
+            high=Decimal("1.1050"),
+            low=Decimal("1.0950"),
+            close=Decimal("1.1025"),
+            volume=Decimal("10000"),
+        )
+        assert bar.range == Decimal("0.0100")
+        wider = bar.model_copy(update={"high": Decimal("1.1150")})
+        assert wider.range == Decimal("0.0200")
+        assert wider.midrange == Decimal("1.1050")
+        assert bar.model_copy().range == Decimal("0.0100")
+
 
 class TestBarImmutability:
     """Tests for Bar immutability (frozen model)."""
@@ -306,13 +385,7 @@ class TestBarSerialization:
             volume=Decimal("10000"),
         )
         json_str = bar.model_dump_json()
-        bar2 = Bar.model_validate_json(json_str)
-        assert bar.symbol == bar2.symbol
-        assert bar.open == bar2.open
-        assert bar.high == bar2.high
-        assert bar.low == bar2.low
-        assert bar.close == bar2.close
-        assert bar.volume == bar2.volume
+        assert Bar.model_validate_json(json_str) == bar
 
     def test_dict_serialization(self, sample_timestamp: datetime) -> None:
         bar = Bar(
@@ -329,6 +402,166 @@ class TestBarSerialization:
         assert "open" in data
 
 
+class TestBarFromArrays:
+    """Tests for the Bar.from_arrays batch constructor."""
+
+    def test_matches_validated_construction(self, sample_timestamp: datetime) -> None:
+        bars = Bar.from_arrays(
+            [sample_timestamp, sample_timestamp],
+            "eur_usd",
+            [Decimal("1.1000"), Decimal("1.1025")],
+            [Decimal("1.1050"), Decimal("1.1060")],
+            [Decimal("1.0950"), Decimal("1.1000")],
+            [Decimal("1.1025"), Decimal("1.1040")],
+            [Decimal("10000"), Decimal("0")],
+        )
+        expected = Bar(
+            timestamp=sample_timestamp,
+            symbol="EUR_USD",
+            open=Decimal("1.1000"),
+            high=Decimal("1.1050"),
+            low=Decimal("1.0950"),
+            close=Decimal("1.1025"),
+            volume=Decimal("10000"),
+        )
+        assert len(bars) == 2
+        assert bars[0] == expected
+        assert bars[1].symbol == "EUR_USD"
+
+    def test_batch_bars_behave_like_validated_bars(
+        self, sample_timestamp: datetime
+    ) -> None:
+        (bar,) = Bar.from_arrays(
+            [sample_timestamp],
+            "EUR_USD",
+            [Decimal("1")],
+            [Decimal("2")],
+            [Decimal("1")],
+            [Decimal("2")],
+            [Decimal("5")],
+        )
+        assert bar.model_dump()["volume"] == "5"
+        assert bar.model_copy(update={"volume": Decimal("6")}).volume == Decimal("6")
+        with pytest.raises(ValidationError):
+            bar.volume = Decimal("7")  # type: ignore[misc]
+
+    def test_per_row_symbols(self, sample_timestamp: datetime) -> None:
+        bars = Bar.from_arrays(
+            [sample_timestamp] * 2,
+            ["eur_usd", "BTC-USD"],
+            [Decimal("1")] * 2,
+            [Decimal("2")] * 2,
+            [Decimal("1")] * 2,
+            [Decimal("2")] * 2,
+            [Decimal("5")] * 2,
+        )
+        assert [bar.symbol for bar in bars] == ["EUR_USD", "BTC-USD"]
+
+    def test_rejects_mismatched_lengths(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValueError, match="same length"):
+            Bar.from_arrays(
+                [sample_timestamp],
+                "EUR_USD",
+                [Decimal("1")],
+                [Decimal("2"), Decimal("2")],
+                [Decimal("1")],
+                [Decimal("2")],
+                [Decimal("5")],
+            )
+
+    def test_reports_invalid_row(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValueError, match="row 1: high must be >= low"):
+            Bar.from_arrays(
+                [sample_timestamp] * 2,
+                "EUR_USD",
+                [Decimal("1")] * 2,
+                [Decimal("2"), Decimal("0.5")],
+                [Decimal("1")] * 2,
+                [Decimal("1")] * 2,
+                [Decimal("5")] * 2,
+            )
+
+    def test_reports_invalid_symbol_row(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValueError, match="row 1: symbol"):
+            Bar.from_arrays(
+                [sample_timestamp] * 2,
+                ["EUR_USD", "eur/usd"],
+                [Decimal("1")] * 2,
+                [Decimal("2")] * 2,
+                [Decimal("1")] * 2,
+                [Decimal("2")] * 2,
+                [Decimal("5")] * 2,
+            )
+
+    def test_rejects_naive_timestamp(self) -> None:
+        with pytest.raises(ValueError, match="row 0: timestamp"):
+            Bar.from_arrays(
+                [datetime(2024, 1, 15)],
+                "EUR_USD",
+                [Decimal("1")],
+                [Decimal("2")],
+                [Decimal("1")],
+                [Decimal("2")],
+                [Decimal("5")],
+            )
+
+
+class TestBarFromValues:
+    """Tests for the Bar.from_values constructor."""
+
+    def test_matches_validated_construction(self, sample_timestamp: datetime) -> None:
+        bar = Bar.from_values(
+            sample_timestamp,
+            " eur_usd ",
+            Decimal("1.1000"),
+            Decimal("1.1050"),
+            Decimal("1.0950"),
+            Decimal("1.1025"),
+            Decimal("10000"),
+        )
+        expected = Bar(
+            timestamp=sample_timestamp,
+            symbol="EUR_USD",
+            open=Decimal("1.1000"),
+            high=Decimal("1.1050"),
+            low=Decimal("1.0950"),
+            close=Decimal("1.1025"),
+            volume=Decimal("10000"),
+        )
+        assert bar == expected
+        assert bar.model_dump() == expected.model_dump()
+        assert bar.range == Decimal("0.0100")
+
+    @pytest.mark.parametrize(
+        ("prices", "message"),
+        [
+            (("1.0", "1.2", "0", "1.1", "1"), "price fields must be > 0"),
+            (("1.0", "1.2", "0.9", "1.1", "-1"), "volume must be >= 0"),
+            (("1.0", "0.9", "1.1", "1.0", "1"), "high must be >= low"),
+            (("1.3", "1.2", "0.9", "1.1", "1"), "high must be >= open"),
+            (("1.0", "1.2", "1.05", "1.1", "1"), "low must be <= open"),
+        ],
+    )
+    def test_rejects_invalid_ohlcv(
+        self, sample_timestamp: datetime, prices: tuple[str, ...], message: str
+    ) -> None:
+        o, h, lo, c, v = (Decimal(p) for p in prices)
+        with pytest.raises(ValueError, match=message):
+            Bar.from_values(sample_timestamp, "EUR_USD", o, h, lo, c, v)
+
+    def test_rejects_naive_timestamp(self) -> None:
+        with pytest.raises(ValueError, match="timezone-aware"):
+            Bar.from_values(
+                datetime(2024, 1, 15),
+                "EUR_USD",
+                Decimal("1"),
+                Decimal("1"),
+                Decimal("1"),
+                Decimal("1"),
+                Decimal("1"),
+            )
+
+
 class TestBarPropertyBased:
     """Property-based tests using Hypothesis."""
 
@@ -385,3 +618,33 @@ class TestBarPropertyBased:
             volume=volume,
         )
         assert bar.volume >= 0
+
+
+class TestBarConstructUnchecked:
+    """Tests for the trusted Bar constructor."""
+
+    def test_matches_validated_bar(self, sample_timestamp: datetime) -> None:
+        values = {
+            "timestamp": sample_timestamp,
+            "symbol": "EUR_USD",
+            "open": Decimal("1.1000"),
+            "high": Decimal("1.1050"),
+            "low": Decimal("1.0950"),
+            "close": Decimal("1.1025"),
+            "volume": Decimal("10000"),
+        }
+        bar = Bar.construct_unchecked(**values)
+        assert bar == Bar(**values)
+        assert bar.midrange == Decimal("1.1000")
+
+    def test_skips_validation(self, sample_timestamp: datetime) -> None:
+        bar = Bar.construct_unchecked(
+            timestamp=sample_timestamp,
+            symbol="EUR_USD",
+            open=Decimal("1"),
+            high=Decimal("0.5"),
+            low=Decimal("2"),
+            close=Decimal("1"),
+            volume=Decimal("0"),
+        )
+        assert bar.range == Decimal("-1.5")
@@ -0,0 +1,57 @@
+"""Tests for liq.core.bar_frame module."""
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from liq.core import Bar, BarFrame
+
+ColumnBuilder = Callable[..., dict[str, Any]]
+
+
+class TestBarFrame:
+    """Tests for BarFrame construction and row access."""
+
+    def test_from_columns_matches_bars(self, bar_columns: ColumnBuilder) -> None:
+        cols = bar_columns()
+        frame = BarFrame.from_columns(**cols)
+        assert len(frame) == 3
+        assert frame.symbols == ("EUR_USD",) * 3
+        assert frame.to_bars() == Bar.from_arrays(**cols)
+        assert list(frame) == frame.to_bars()
+
+    def test_row_is_a_usable_bar(self, bar_columns: ColumnBuilder) -> None:
+        frame = BarFrame.from_columns(**bar_columns())
+        bar = frame.row(-1)
+        assert isinstance(bar, Bar)
+        assert bar.high == Decimal("1.14")
+        assert bar.range == Decimal("0.03")
+        assert bar.model_dump()["symbol"] == "EUR_USD"
+
+    def test_from_bars_round_trip(self, bar_columns: ColumnBuilder) -> None:
+        bars = Bar.from_arrays(**bar_columns())
+        assert BarFrame.from_bars(bars).to_bars() == bars
+
+    def test_true_range_matches_bar_batch(self, bar_columns: ColumnBuilder) -> None:
+        cols = bar_columns(5)
+        cols["highs"][2] = Decimal("1.30")
+        frame = BarFrame.from_columns(**cols)
+        assert frame.true_range_hl() == Bar.true_range_hl_batch(frame.to_bars())
+
+    def test_rejects_invalid_row(self, bar_columns: ColumnBuilder) -> None:
+        cols = bar_columns()
+        cols["lows"][1] = Decimal("2")
+        with pytest.raises(ValueError, match="row 1"):
+            BarFrame.from_columns(**cols)
+
+    def test_is_frozen(self, bar_columns: ColumnBuilder) -> None:
+        frame = BarFrame.from_columns(**bar_columns())
+        with pytest.raises(AttributeError):
+            frame.highs = ()  # type: ignore[misc]
+
+    def test_empty_frame(self) -> None:
+        frame = BarFrame.from_bars([])
+        assert len(frame) == 0
+        assert frame.true_range_hl() == []
@@ -33,3 +33,48 @@ def test_true_range_hl() -> None:
         volume=Decimal("10"),
     )
     assert bar.true_range_hl(Decimal("1.8"), Decimal("0.4")) == Decimal("1.5")
+
+
+def test_true_range_uses_gap_when_larger() -> None:
+    bar = Bar(
+        timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+        symbol="EUR_USD",
+        open=Decimal("1.0"),
+        high=Decimal("2.0"),
+        low=Decimal("0.5"),
+        close=Decimal("1.5"),
+        volume=Decimal("10"),
+    )
+    assert bar.true_range_midrange(None) == Decimal("1.5")
+    assert bar.true_range_midrange(Decimal("3.5")) == Decimal("2.25")
+    assert bar.true_range_hl(None, None) == Decimal("1.5")
+    assert bar.true_range_hl(Decimal("4.0"), None) == Decimal("2.0")
+    assert bar.true_range_hl(None, Decimal("2.5")) == Decimal("2.0")
+
+
+def test_true_range_batches_match_scalar_calls() -> None:
+    ts = datetime(2024, 1, 1, tzinfo=UTC)
+    rows = [("1.0", "2.0", "0.5"), ("2.5", "3.0", "2.4"), ("1.0", "1.2", "0.9")]
+    bars = [
+        Bar(
+            timestamp=ts,
+            symbol="EUR_USD",
+            open=Decimal(o),
+            high=Decimal(h),
+            low=Decimal(lo),
+            close=Decimal(o),
+            volume=Decimal("10"),
+        )
+        for o, h, lo in rows
+    ]
+    expected_hl = [bars[0].true_range_hl(None, None)] + [
+        bar.true_range_hl(prev.high, prev.low)
+        for prev, bar in zip(bars, bars[1:], strict=False)
+    ]
+    expected_mid = [bars[0].true_range_midrange(None)] + [
+        bar.true_range_midrange(prev.midrange)
+        for prev, bar in zip(bars, bars[1:], strict=False)
+    ]
+    assert Bar.true_range_hl_batch(bars) == expected_hl
+    assert Bar.true_range_midrange_batch(bars) == expected_mid
+    assert Bar.true_range_hl_batch([]) == []
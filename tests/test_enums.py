@@ -1,8 +1,11 @@
 """Tests for liq.core.enums module."""
 
 from liq.core.enums import (
+    ActionType,
     AssetClass,
     Currency,
+    EntryType,
+    MovementType,
     OrderSide,
     OrderStatus,
     OrderType,
@@ -262,6 +265,42 @@ class TestOrderStatus:
         assert members == expected
 
 
+class TestMovementType:
+    """Tests for MovementType enum."""
+
+    def test_str_enum_conversion(self) -> None:
+        assert str(MovementType.DEPOSIT) == "deposit"
+        assert MovementType("fee") == MovementType.FEE
+
+    def test_all_members(self) -> None:
+        members = {m.value for m in MovementType}
+        assert members == {"deposit", "withdrawal", "dividend", "interest", "fee"}
+
+
+class TestActionType:
+    """Tests for ActionType enum."""
+
+    def test_str_enum_conversion(self) -> None:
+        assert str(ActionType.SPLIT) == "split"
+        assert ActionType("merger") == ActionType.MERGER
+
+    def test_all_members(self) -> None:
+        members = {m.value for m in ActionType}
+        assert members == {"split", "dividend", "spinoff", "merger"}
+
+
+class TestEntryType:
+    """Tests for EntryType enum."""
+
+    def test_str_enum_conversion(self) -> None:
+        assert str(EntryType.CORPORATE_ACTION) == "corporate_action"
+        assert EntryType("margin_call") == EntryType.MARGIN_CALL
+
+    def test_all_members(self) -> None:
+        members = {m.value for m in EntryType}
+        assert members == {"fill", "cash", "corporate_action", "margin_call"}
+
+
 class TestEnumJsonSerialization:
     """Test that enums serialize correctly to JSON."""
 
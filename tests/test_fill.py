@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from decimal import Decimal
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 import pytest
 from pydantic import ValidationError
 
+from liq.core.enums import OrderSide
 from liq.core.fill import Fill
 
 
@@ -33,206 +34,90 @@ class TestFillCreation:
         assert fill.client_order_id == order_id
         assert fill.realized_pnl is None
 
-    def test_create_fill_with_zero_commission(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0"),
-            timestamp=sample_timestamp,
+    def test_create_fill_with_zero_commission(self, canonical_fill: Fill) -> None:
+        fill = Fill.model_validate(
+            {**canonical_fill.model_dump(), "commission": Decimal("0")}
         )
         assert fill.commission == Decimal("0")
 
-    def test_fill_has_fill_id(self, sample_timestamp: datetime) -> None:
+    def test_fill_has_fill_id(self, canonical_fill: Fill) -> None:
         fill_id = uuid4()
-        fill = Fill(
-            fill_id=fill_id,
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+        fill = Fill.model_validate({**canonical_fill.model_dump(), "fill_id": fill_id})
         assert fill.fill_id == fill_id
-        assert isinstance(fill.fill_id, UUID)
 
-    def test_fill_default_slippage(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+    def test_fill_default_slippage(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill
         assert fill.slippage is None
-
-    def test_fill_with_slippage(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1005"),
-            commission=Decimal("0.50"),
-            slippage=Decimal("0.0005"),
-            realized_pnl=Decimal("25"),
-            timestamp=sample_timestamp,
+        assert fill.provider is None
+
+    def test_fill_with_slippage(self, canonical_fill: Fill) -> None:
+        fill = Fill.model_validate(
+            {
+                **canonical_fill.model_dump(),
+                "price": Decimal("1.1005"),
+                "slippage": Decimal("0.0005"),
+                "realized_pnl": Decimal("25"),
+                "provider": "oanda",
+            }
         )
         assert fill.slippage == Decimal("0.0005")
         assert fill.realized_pnl == Decimal("25")
+        assert fill.provider == "oanda"
 
 
 class TestFillValidation:
     """Tests for Fill validation."""
 
-    def test_rejects_naive_datetime(self) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="EUR_USD",
-                side="buy",
-                quantity=Decimal("10000"),
-                price=Decimal("1.1000"),
-                commission=Decimal("0.50"),
-                timestamp=datetime(2024, 1, 15),  # No timezone
-            )
-        assert "timezone" in str(exc_info.value).lower()
-
-    def test_rejects_zero_quantity(self, sample_timestamp: datetime) -> None:
+    @pytest.mark.parametrize(
+        ("field", "value", "error"),
+        [
+            ("timestamp", datetime(2024, 1, 15), "timezone"),  # naive
+            ("quantity", Decimal("0"), "quantity"),
+            ("quantity", Decimal("-100"), "quantity"),
+            ("price", Decimal("0"), "price"),
+            ("commission", Decimal("-0.50"), "commission"),
+            ("side", "invalid", "side"),
+            ("symbol", "eur/usd", "symbol"),
+        ],
+    )
+    def test_rejects_invalid_field(
+        self, canonical_fill: Fill, field: str, value: object, error: str
+    ) -> None:
         with pytest.raises(ValidationError) as exc_info:
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="EUR_USD",
-                side="buy",
-                quantity=Decimal("0"),
-                price=Decimal("1.1000"),
-                commission=Decimal("0.50"),
-                timestamp=sample_timestamp,
-            )
-        assert "quantity" in str(exc_info.value).lower()
+            Fill.model_validate({**canonical_fill.model_dump(), field: value})
+        assert error in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["loc"] == (field,)
 
-    def test_rejects_negative_quantity(self, sample_timestamp: datetime) -> None:
+    def test_reports_each_invalid_field(self, canonical_fill: Fill) -> None:
         with pytest.raises(ValidationError) as exc_info:
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="EUR_USD",
-                side="buy",
-                quantity=Decimal("-100"),
-                price=Decimal("1.1000"),
-                commission=Decimal("0.50"),
-                timestamp=sample_timestamp,
-            )
-        assert "quantity" in str(exc_info.value).lower()
-
-    def test_rejects_non_positive_price(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="EUR_USD",
-                side="buy",
-                quantity=Decimal("10000"),
-                price=Decimal("0"),
-                commission=Decimal("0.50"),
-                timestamp=sample_timestamp,
-            )
-        assert "price" in str(exc_info.value).lower()
-
-    def test_rejects_negative_commission(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="EUR_USD",
-                side="buy",
-                quantity=Decimal("10000"),
-                price=Decimal("1.1000"),
-                commission=Decimal("-0.50"),
-                timestamp=sample_timestamp,
-            )
-        assert "commission" in str(exc_info.value).lower()
-
-    def test_rejects_invalid_side(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="EUR_USD",
-                side="invalid",  # type: ignore[arg-type]
-                quantity=Decimal("10000"),
-                price=Decimal("1.1000"),
-                commission=Decimal("0.50"),
-                timestamp=sample_timestamp,
-            )
-
-    def test_rejects_invalid_symbol(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            Fill(
-                fill_id=uuid4(),
-                client_order_id=uuid4(),
-                symbol="eur/usd",
-                side="buy",
-                quantity=Decimal("10000"),
-                price=Decimal("1.1000"),
-                commission=Decimal("0.50"),
-                timestamp=sample_timestamp,
+            Fill.model_validate(
+                {
+                    **canonical_fill.model_dump(),
+                    "quantity": Decimal("0"),
+                    "commission": Decimal("-1"),
+                }
             )
+        assert [e["loc"] for e in exc_info.value.errors()] == [
+            ("quantity",),
+            ("commission",),
+        ]
 
 
 class TestFillDerivedFields:
     """Tests for Fill computed properties."""
 
-    def test_notional_value_calculation(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+    def test_notional_value_calculation(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill
         # notional = quantity * price = 10000 * 1.1000 = 11000
         assert fill.notional_value == Decimal("11000")
 
-    def test_total_cost_buy(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+    def test_total_cost_buy(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill
         # For buy: total_cost = notional + commission = 11000 + 0.50 = 11000.50
         assert fill.total_cost == Decimal("11000.50")
 
-    def test_total_cost_sell(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="sell",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+    def test_total_cost_sell(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill.model_copy(update={"side": OrderSide.SELL})
         # For sell: total_cost = -notional + commission = -11000 + 0.50 = -10999.50 (proceeds)
         assert fill.total_cost == Decimal("-10999.50")
 
@@ -240,17 +125,8 @@ class TestFillDerivedFields:
 class TestFillImmutability:
     """Tests for Fill immutability (frozen model)."""
 
-    def test_fill_is_frozen(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+    def test_fill_is_frozen(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill
         with pytest.raises(ValidationError):
             fill.symbol = "USD_JPY"  # type: ignore[misc]
 
@@ -258,55 +134,27 @@ class TestFillImmutability:
 class TestFillSerialization:
     """Tests for Fill serialization."""
 
-    def test_json_serialization(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
-        json_str = fill.model_dump_json()
-        assert "EUR_USD" in json_str
-        assert "buy" in json_str
-        assert "realized_pnl" in json_str
-
-    def test_json_roundtrip(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            realized_pnl=Decimal("10"),
-            timestamp=sample_timestamp,
-        )
+    def test_json_serialize_and_roundtrip(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill.model_copy(update={"realized_pnl": Decimal("10")})
         json_str = fill.model_dump_json()
-        fill2 = Fill.model_validate_json(json_str)
-        assert fill.symbol == fill2.symbol
-        assert fill.side == fill2.side
-        assert fill.quantity == fill2.quantity
-        assert fill.price == fill2.price
-        assert fill.commission == fill2.commission
-        assert fill.realized_pnl == fill2.realized_pnl
+        assert '"symbol":"EUR_USD"' in json_str
+        assert '"side":"buy"' in json_str
+        assert '"realized_pnl":"10"' in json_str
+        assert Fill.model_validate_json(json_str) == fill
 
-    def test_dict_serialization(self, sample_timestamp: datetime) -> None:
-        fill = Fill(
-            fill_id=uuid4(),
-            client_order_id=uuid4(),
-            symbol="EUR_USD",
-            side="buy",
-            quantity=Decimal("10000"),
-            price=Decimal("1.1000"),
-            commission=Decimal("0.50"),
-            timestamp=sample_timestamp,
-        )
+    def test_dict_serialization(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill
         data = fill.model_dump()
         assert data["symbol"] == "EUR_USD"
         assert data["side"] == "buy"
         assert "realized_pnl" in data
+
+    def test_decimals_dump_as_exact_strings(self, canonical_fill: Fill) -> None:
+        fill = canonical_fill.model_copy(
+            update={"side": OrderSide.SELL, "quantity": Decimal("1E+4")}
+        )
+        data = fill.model_dump()
+        assert data["quantity"] == "1E+4"
+        assert data["price"] == "1.1000"
+        assert data["slippage"] is None
+        assert '"commission":"0.50"' in fill.model_dump_json()
@@ -23,7 +23,6 @@ def sample_fill(ts: datetime) -> Fill:
         quantity=Decimal("100"),
         price=Decimal("1.1000"),
         commission=Decimal("0.1"),
-        provider="oanda",
         timestamp=ts,
     )
 
@@ -44,6 +43,21 @@ def test_trade_model() -> None:
     assert trade.holding_period == 5
 
 
+def test_trade_construct_unchecked_matches_validated() -> None:
+    ts = datetime(2024, 1, 1, tzinfo=UTC)
+    values = {
+        "symbol": "EUR_USD",
+        "entry_fill": sample_fill(ts),
+        "exit_fill": sample_fill(ts.replace(hour=2)),
+        "pnl": Decimal("10.0"),
+        "return_pct": Decimal("0.01"),
+        "holding_period": 5,
+    }
+    trade = Trade.construct_unchecked(**values)
+    assert trade == Trade(**values)
+    assert trade.model_dump() == Trade(**values).model_dump()
+
+
 def test_cash_movement_requires_timezone() -> None:
     with pytest.raises(ValidationError):
         CashMovement(
@@ -64,6 +78,16 @@ def test_cash_movement_valid() -> None:
     assert cm.amount == Decimal("100")
 
 
+def test_cash_movement_rejects_unknown_type() -> None:
+    with pytest.raises(ValidationError):
+        CashMovement(
+            timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+            amount=Decimal("100"),
+            currency="USD",
+            movement_type="transfer",
+        )
+
+
 def test_corporate_action_requires_timezone() -> None:
     with pytest.raises(ValidationError):
         CorporateAction(
@@ -81,3 +105,24 @@ def test_ledger_entry_conditionals() -> None:
 
     entry = LedgerEntry(timestamp=ts, entry_type="fill", fill=sample_fill(ts))
     assert entry.fill is not None
+
+
+@pytest.mark.parametrize(
+    ("entry_type", "field"),
+    [
+        ("cash", "cash_movement"),
+        ("corporate_action", "corporate_action"),
+    ],
+)
+def test_ledger_entry_requires_matching_payload(entry_type: str, field: str) -> None:
+    ts = datetime(2024, 1, 1, tzinfo=UTC)
+    with pytest.raises(
+        ValidationError, match=f"{field} is required when entry_type is {entry_type}"
+    ):
+        LedgerEntry(timestamp=ts, entry_type=entry_type)
+
+
+def test_ledger_margin_call_needs_no_payload() -> None:
+    ts = datetime(2024, 1, 1, tzinfo=UTC)
+    entry = LedgerEntry(timestamp=ts, entry_type="margin_call")
+    assert entry.fill is None
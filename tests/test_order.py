@@ -1,5 +1,6 @@
 """Tests for liq.core.order module."""
 
+import json
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
@@ -9,11 +10,19 @@ from pydantic import ValidationError
 
 from liq.core.order import OrderRequest
 
+# (order_type, limit_price, stop_price) for each supported order type
+ORDER_TYPE_CASES = [
+    ("market", None, None),
+    ("limit", Decimal("1.1000"), None),
+    ("stop", None, Decimal("1.0900")),
+    ("stop_limit", Decimal("1.0880"), Decimal("1.0900")),
+]
+
 
 class TestOrderRequestCreation:
     """Tests for OrderRequest model creation."""
 
-    def test_create_market_order(self, sample_timestamp: datetime) -> None:
+    def test_create_order_with_metadata(self, sample_timestamp: datetime) -> None:
         order = OrderRequest(
             symbol="EUR_USD",
             side="buy",
@@ -34,43 +43,30 @@ class TestOrderRequestCreation:
         assert order.confidence == 0.8
         assert order.tags == {"version": "v1"}
 
-    def test_create_limit_order(self, sample_timestamp: datetime) -> None:
+    @pytest.mark.parametrize(
+        ("order_type", "limit_price", "stop_price"),
+        ORDER_TYPE_CASES,
+        ids=["market", "limit", "stop", "stop_limit"],
+    )
+    def test_create_order(
+        self,
+        sample_timestamp: datetime,
+        order_type: str,
+        limit_price: Decimal | None,
+        stop_price: Decimal | None,
+    ) -> None:
         order = OrderRequest(
             symbol="EUR_USD",
             side="buy",
-            order_type="limit",
+            order_type=order_type,
             quantity=Decimal("10000"),
-            limit_price=Decimal("1.1000"),
+            limit_price=limit_price,
+            stop_price=stop_price,
             timestamp=sample_timestamp,
         )
-        assert order.order_type == "limit"
-        assert order.limit_price == Decimal("1.1000")
-
-    def test_create_stop_order(self, sample_timestamp: datetime) -> None:
-        order = OrderRequest(
-            symbol="EUR_USD",
-            side="sell",
-            order_type="stop",
-            quantity=Decimal("10000"),
-            stop_price=Decimal("1.0900"),
-            timestamp=sample_timestamp,
-        )
-        assert order.order_type == "stop"
-        assert order.stop_price == Decimal("1.0900")
-
-    def test_create_stop_limit_order(self, sample_timestamp: datetime) -> None:
-        order = OrderRequest(
-            symbol="EUR_USD",
-            side="sell",
-            order_type="stop_limit",
-            quantity=Decimal("10000"),
-            limit_price=Decimal("1.0880"),
-            stop_price=Decimal("1.0900"),
-            timestamp=sample_timestamp,
-        )
-        assert order.order_type == "stop_limit"
-        assert order.limit_price == Decimal("1.0880")
-        assert order.stop_price == Decimal("1.0900")
+        assert order.order_type == order_type
+        assert order.limit_price == limit_price
+        assert order.stop_price == stop_price
 
     def test_order_has_client_order_id(self, sample_timestamp: datetime) -> None:
         order = OrderRequest(
@@ -109,163 +105,53 @@ class TestOrderRequestCreation:
 class TestOrderRequestValidation:
     """Tests for OrderRequest validation."""
 
-    def test_rejects_naive_datetime(self) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="market",
-                quantity=Decimal("10000"),
-                timestamp=datetime(2024, 1, 15),  # No timezone
-            )
-        assert "timezone" in str(exc_info.value).lower()
-
-    def test_rejects_zero_quantity(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="market",
-                quantity=Decimal("0"),
-                timestamp=sample_timestamp,
-            )
-        assert "quantity" in str(exc_info.value).lower()
-
-    def test_rejects_negative_quantity(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="market",
-                quantity=Decimal("-100"),
-                timestamp=sample_timestamp,
-            )
-        assert "quantity" in str(exc_info.value).lower()
-
-    def test_limit_order_requires_limit_price(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="limit",
-                quantity=Decimal("10000"),
-                timestamp=sample_timestamp,
-                # Missing limit_price
-            )
-        assert "limit_price" in str(exc_info.value).lower()
-
-    def test_stop_order_requires_stop_price(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="sell",
-                order_type="stop",
-                quantity=Decimal("10000"),
-                timestamp=sample_timestamp,
-                # Missing stop_price
-            )
-        assert "stop_price" in str(exc_info.value).lower()
-
-    def test_stop_limit_requires_both_prices(self, sample_timestamp: datetime) -> None:
-        # Missing limit_price
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="sell",
-                order_type="stop_limit",
-                quantity=Decimal("10000"),
-                stop_price=Decimal("1.0900"),
-                timestamp=sample_timestamp,
-            )
-        assert "limit_price" in str(exc_info.value).lower()
-
-        # Missing stop_price
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="sell",
-                order_type="stop_limit",
-                quantity=Decimal("10000"),
-                limit_price=Decimal("1.0880"),
-                timestamp=sample_timestamp,
-            )
-        assert "stop_price" in str(exc_info.value).lower()
-
-    def test_rejects_non_positive_limit_price(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="limit",
-                quantity=Decimal("10000"),
-                limit_price=Decimal("0"),
-                timestamp=sample_timestamp,
-            )
-        assert "limit_price" in str(exc_info.value).lower()
-
-    def test_rejects_non_positive_stop_price(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError) as exc_info:
-            OrderRequest(
-                symbol="EUR_USD",
-                side="sell",
-                order_type="stop",
-                quantity=Decimal("10000"),
-                stop_price=Decimal("-1"),
-                timestamp=sample_timestamp,
-            )
-        assert "stop_price" in str(exc_info.value).lower()
-
-    def test_rejects_invalid_side(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            OrderRequest(
-                symbol="EUR_USD",
-                side="invalid",  # type: ignore[arg-type]
-                order_type="market",
-                quantity=Decimal("10000"),
-                timestamp=sample_timestamp,
-            )
-
-    def test_rejects_confidence_out_of_range(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="market",
-                quantity=Decimal("10000"),
-                confidence=1.5,
-                timestamp=sample_timestamp,
-            )
-
-    def test_rejects_invalid_order_type(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="invalid",  # type: ignore[arg-type]
-                quantity=Decimal("10000"),
-                timestamp=sample_timestamp,
-            )
-
-    def test_rejects_invalid_time_in_force(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            OrderRequest(
-                symbol="EUR_USD",
-                side="buy",
-                order_type="market",
-                quantity=Decimal("10000"),
-                time_in_force="invalid",  # type: ignore[arg-type]
-                timestamp=sample_timestamp,
-            )
-
-    def test_rejects_invalid_symbol(self, sample_timestamp: datetime) -> None:
-        with pytest.raises(ValidationError):
-            OrderRequest(
-                symbol="eur/usd",
-                side="buy",
-                order_type="market",
-                quantity=Decimal("10000"),
-                timestamp=sample_timestamp,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "error"),
+        [
+            ({"timestamp": datetime(2024, 1, 15)}, "timezone"),  # naive
+            ({"quantity": Decimal("0")}, "quantity"),
+            ({"quantity": Decimal("-100")}, "quantity"),
+            ({"order_type": "limit"}, "limit_price"),
+            ({"order_type": "stop"}, "stop_price"),
+            (
+                {"order_type": "stop_limit", "stop_price": Decimal("1.0900")},
+                "limit_price",
+            ),
+            (
+                {"order_type": "stop_limit", "limit_price": Decimal("1.0880")},
+                "stop_price",
+            ),
+            ({"order_type": "limit", "limit_price": Decimal("0")}, "limit_price"),
+            ({"order_type": "stop", "stop_price": Decimal("-1")}, "stop_price"),
+            ({"side": "invalid"}, "side"),
+            ({"confidence": 1.5}, "confidence"),
+            ({"order_type": "invalid"}, "order_type"),
+            ({"time_in_force": "invalid"}, "time_in_force"),
+            ({"symbol": "eur/usd"}, "symbol"),
+        ],
+        ids=[
+            "naive_timestamp",
+            "zero_quantity",
+            "negative_quantity",
+            "limit_missing_limit_price",
+            "stop_missing_stop_price",
+            "stop_limit_missing_limit_price",
+            "stop_limit_missing_stop_price",
+            "non_positive_limit_price",
+            "non_positive_stop_price",
+            "invalid_side",
+            "confidence_out_of_range",
+            "invalid_order_type",
+            "invalid_time_in_force",
+            "invalid_symbol",
+        ],
+    )
+    def test_rejects_invalid_order(
+        self, market_order: OrderRequest, overrides: dict, error: str
+    ) -> None:
+        data = {**market_order.model_dump(exclude_unset=True), **overrides}
+        with pytest.raises(ValidationError, match=error):
+            OrderRequest.model_validate(data)
 
 
 class TestOrderRequestImmutability:
@@ -286,51 +172,49 @@ class TestOrderRequestImmutability:
 class TestOrderRequestSerialization:
     """Tests for OrderRequest serialization."""
 
-    def test_json_serialization(self, sample_timestamp: datetime) -> None:
+    def test_json_serialize_and_roundtrip(self, sample_timestamp: datetime) -> None:
         order = OrderRequest(
             symbol="EUR_USD",
             side="buy",
             order_type="limit",
             quantity=Decimal("10000"),
             limit_price=Decimal("1.1000"),
+            time_in_force="gtc",
             timestamp=sample_timestamp,
         )
         json_str = order.model_dump_json()
-        assert "EUR_USD" in json_str
-        assert "buy" in json_str
-        assert "limit" in json_str
+        data = json.loads(json_str)
+        assert data["symbol"] == "EUR_USD"
+        assert data["side"] == "buy"
+        assert data["order_type"] == "limit"
+        assert data["limit_price"] == "1.1000"
+        assert OrderRequest.model_validate_json(json_str) == order
 
-    def test_json_roundtrip(self, sample_timestamp: datetime) -> None:
+    def test_dict_serialization(self, sample_timestamp: datetime) -> None:
         order = OrderRequest(
             symbol="EUR_USD",
             side="buy",
-            order_type="limit",
+            order_type="market",
             quantity=Decimal("10000"),
-            limit_price=Decimal("1.1000"),
-            time_in_force="gtc",
             timestamp=sample_timestamp,
         )
-        json_str = order.model_dump_json()
-        order2 = OrderRequest.model_validate_json(json_str)
-        assert order.symbol == order2.symbol
-        assert order.side == order2.side
-        assert order.order_type == order2.order_type
-        assert order.quantity == order2.quantity
-        assert order.limit_price == order2.limit_price
-        assert order.time_in_force == order2.time_in_force
+        data = order.model_dump()
+        assert data["symbol"] == "EUR_USD"
+        assert data["side"] == "buy"
+        assert data["order_type"] == "market"
 
-    def test_dict_serialization(self, sample_timestamp: datetime) -> None:
+    def test_dict_enums_are_plain_strings(self, sample_timestamp: datetime) -> None:
         order = OrderRequest(
             symbol="EUR_USD",
-            side="buy",
+            side="sell",
             order_type="market",
             quantity=Decimal("10000"),
             timestamp=sample_timestamp,
         )
         data = order.model_dump()
-        assert data["symbol"] == "EUR_USD"
-        assert data["side"] == "buy"
-        assert data["order_type"] == "market"
+        for key in ("side", "order_type", "time_in_force"):
+            assert type(data[key]) is str
+        assert data["time_in_force"] == "day"
 
 
 class TestOrderRequestPolicyId:
@@ -358,6 +242,23 @@ class TestOrderRequestPolicyId:
         )
         assert order.policy_id == "policy_v1"
 
+    def test_string_inputs_are_stripped(self, sample_timestamp: datetime) -> None:
+        order = OrderRequest(
+            symbol="EUR_USD",
+            side="buy",
+            order_type="market",
+            quantity=Decimal("10000"),
+            timestamp=sample_timestamp,
+            policy_id="  policy_v1 ",
+            external_client_order_id=" ext-1 ",
+            tags={" note ": " trimmed "},
+            metadata={" source ": " raw ", "levels": [" a "]},
+        )
+        assert order.policy_id == "policy_v1"
+        assert order.external_client_order_id == "ext-1"
+        assert order.tags == {"note": "trimmed"}
+        assert order.metadata == {"source": " raw ", "levels": [" a "]}
+
     def test_policy_id_rejects_empty_string(self, sample_timestamp: datetime) -> None:
         with pytest.raises(ValidationError, match="policy_id"):
             OrderRequest(
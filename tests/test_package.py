@@ -0,0 +1,39 @@
+"""Tests for the liq.core package namespace."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import liq.core
+
+
+class TestLazyExports:
+    """Tests for lazily imported model exports."""
+
+    def test_all_exports_resolve(self) -> None:
+        for name in liq.core.__all__:
+            assert getattr(liq.core, name) is not None
+
+    def test_lazy_model_is_module_class(self) -> None:
+        from liq.core.bar import Bar
+
+        assert liq.core.Bar is Bar
+        assert "Bar" in dir(liq.core)
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError, match="NotAModel"):
+            _ = liq.core.NotAModel
+
+    def test_import_does_not_load_pydantic(self) -> None:
+        code = "import sys, liq.core; print('pydantic' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(Path(liq.core.__file__).parents[2])},
+        )
+        assert out.stdout.strip() == "False"
@@ -1,15 +1,29 @@
 """Tests for liq.core.portfolio module."""
 
+import json
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
 from pydantic import ValidationError
 
+from liq.core.order import OrderRequest
 from liq.core.portfolio import PortfolioState
 from liq.core.position import Position
 
 
+@pytest.fixture(scope="module")
+def two_position_portfolio(
+    sample_timestamp: datetime, eur_position: Position, btc_position: Position
+) -> PortfolioState:
+    """Return a 75000-cash portfolio holding the shared EUR_USD and BTC-USD positions."""
+    return PortfolioState(
+        cash=Decimal("75000"),
+        positions={"EUR_USD": eur_position, "BTC-USD": btc_position},
+        timestamp=sample_timestamp,
+    )
+
+
 class TestPortfolioStateCreation:
     """Tests for PortfolioState model creation."""
 
@@ -24,21 +38,9 @@ class TestPortfolioStateCreation:
         assert portfolio.unsettled_cash == Decimal("0")
         assert portfolio.day_trades_remaining is None
 
-    def test_create_portfolio_with_positions(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        btc_position = Position(
-            symbol="BTC-USD",
-            quantity=Decimal("0.5"),
-            average_price=Decimal("50000"),
-            realized_pnl=Decimal("100"),
-            timestamp=sample_timestamp,
-        )
+    def test_create_portfolio_with_positions(
+        self, sample_timestamp: datetime, eur_position: Position, btc_position: Position
+    ) -> None:
         portfolio = PortfolioState(
             cash=Decimal("75000"),
             positions={"EUR_USD": eur_position, "BTC-USD": btc_position},
@@ -70,13 +72,12 @@ class TestPortfolioStateValidation:
     """Tests for PortfolioState validation."""
 
     def test_rejects_naive_datetime(self) -> None:
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="timezone"):
             PortfolioState(
                 cash=Decimal("100000"),
                 positions={},
                 timestamp=datetime(2024, 1, 15),  # No timezone
             )
-        assert "timezone" in str(exc_info.value).lower()
 
     def test_accepts_negative_cash(self, sample_timestamp: datetime) -> None:
         """Negative cash (margin) is valid."""
@@ -88,20 +89,12 @@ class TestPortfolioStateValidation:
         assert portfolio.cash == Decimal("-50000")
 
     def test_rejects_invalid_position_key_symbol(
-        self, sample_timestamp: datetime
+        self, sample_timestamp: datetime, eur_position: Position
     ) -> None:
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="position symbol keys"):
             PortfolioState(
                 cash=Decimal("100000"),
-                positions={
-                    "eur/usd": Position(
-                        symbol="EUR_USD",
-                        quantity=Decimal("10000"),
-                        average_price=Decimal("1.1000"),
-                        realized_pnl=Decimal("0"),
-                        timestamp=sample_timestamp,
-                    )
-                },
+                positions={"eur/usd": eur_position},
                 timestamp=sample_timestamp,
             )
 
@@ -119,6 +112,8 @@ class TestPortfolioStateValidation:
             timestamp=sample_timestamp,
         )
         assert "EUR_USD" in portfolio.positions
+        (key,) = portfolio.positions
+        assert key is eur_position.symbol
 
 
 class TestPortfolioStateDerivedFields:
@@ -132,57 +127,24 @@ class TestPortfolioStateDerivedFields:
         )
         assert portfolio.total_market_value == Decimal("0")
 
-    def test_total_market_value_with_positions(
-        self, sample_timestamp: datetime
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            # EUR: 10000 * 1.1000 = 11000; BTC: 0.5 * 50000 = 25000
+            ("total_market_value", Decimal("36000")),
+            # equity = cash + unsettled_cash + total_market_value = 75000 + 0 + 36000
+            ("equity", Decimal("111000")),
+            ("position_count", 2),
+        ],
+    )
+    def test_two_position_derived_field(
+        self, two_position_portfolio: PortfolioState, attr: str, expected: object
     ) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        btc_position = Position(
-            symbol="BTC-USD",
-            quantity=Decimal("0.5"),
-            average_price=Decimal("50000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("75000"),
-            positions={"EUR_USD": eur_position, "BTC-USD": btc_position},
-            timestamp=sample_timestamp,
-        )
-        # EUR: 10000 * 1.1000 = 11000
-        # BTC: 0.5 * 50000 = 25000
-        # Total: 36000
-        assert portfolio.total_market_value == Decimal("36000")
-
-    def test_equity(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("89000"),
-            positions={"EUR_USD": eur_position},
-            timestamp=sample_timestamp,
-        )
-        # equity = cash + unsettled_cash + total_market_value = 89000 + 0 + 11000 = 100000
-        assert portfolio.equity == Decimal("100000")
+        assert getattr(two_position_portfolio, attr) == expected
 
-    def test_equity_with_unsettled_cash(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
+    def test_equity_with_unsettled_cash(
+        self, sample_timestamp: datetime, eur_position: Position
+    ) -> None:
         portfolio = PortfolioState(
             cash=Decimal("89000"),
             unsettled_cash=Decimal("500"),
@@ -192,21 +154,6 @@ class TestPortfolioStateDerivedFields:
         # equity = cash + unsettled_cash + total_market_value = 89000 + 500 + 11000 = 100500
         assert portfolio.equity == Decimal("100500")
 
-    def test_position_count(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("89000"),
-            positions={"EUR_USD": eur_position},
-            timestamp=sample_timestamp,
-        )
-        assert portfolio.position_count == 1
-
     def test_position_count_empty(self, sample_timestamp: datetime) -> None:
         portfolio = PortfolioState(
             cash=Decimal("100000"),
@@ -215,46 +162,14 @@ class TestPortfolioStateDerivedFields:
         )
         assert portfolio.position_count == 0
 
-    def test_symbols(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        btc_position = Position(
-            symbol="BTC-USD",
-            quantity=Decimal("0.5"),
-            average_price=Decimal("50000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("75000"),
-            positions={"EUR_USD": eur_position, "BTC-USD": btc_position},
-            timestamp=sample_timestamp,
-        )
-        symbols = portfolio.symbols
-        assert "EUR_USD" in symbols
-        assert "BTC-USD" in symbols
+    def test_symbols(self, two_position_portfolio: PortfolioState) -> None:
+        assert two_position_portfolio.symbols == ["EUR_USD", "BTC-USD"]
 
-    def test_get_position_existing(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("89000"),
-            positions={"EUR_USD": eur_position},
-            timestamp=sample_timestamp,
-        )
-        pos = portfolio.get_position("EUR_USD")
-        assert pos is not None
-        assert pos.quantity == Decimal("10000")
+    def test_get_position_existing(
+        self, two_position_portfolio: PortfolioState, eur_position: Position
+    ) -> None:
+        pos = two_position_portfolio.get_position("EUR_USD")
+        assert pos == eur_position
 
     def test_get_position_not_found(self, sample_timestamp: datetime) -> None:
         portfolio = PortfolioState(
@@ -264,51 +179,61 @@ class TestPortfolioStateDerivedFields:
         )
         assert portfolio.get_position("EUR_USD") is None
 
-    def test_total_unrealized_pnl(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        btc_position = Position(
-            symbol="BTC-USD",
-            quantity=Decimal("0.5"),
-            average_price=Decimal("50000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("75000"),
-            positions={"EUR_USD": eur_position, "BTC-USD": btc_position},
-            timestamp=sample_timestamp,
-        )
+    def test_total_unrealized_pnl(self, two_position_portfolio: PortfolioState) -> None:
         current_prices = {
             "EUR_USD": Decimal("1.1050"),  # +50 profit (10000 * 0.0050)
             "BTC-USD": Decimal("51000"),  # +500 profit (0.5 * 1000)
         }
-        total_unrealized = portfolio.total_unrealized_pnl(current_prices)
+        total_unrealized = two_position_portfolio.total_unrealized_pnl(current_prices)
         assert total_unrealized == Decimal("550")
 
     def test_total_unrealized_pnl_missing_price(
+        self, two_position_portfolio: PortfolioState
+    ) -> None:
+        # Missing price for BTC-USD should raise KeyError
+        with pytest.raises(KeyError):
+            two_position_portfolio.total_unrealized_pnl({"EUR_USD": Decimal("1.1050")})
+
+    def test_aggregates_after_model_copy_with_new_positions(
         self, sample_timestamp: datetime
     ) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
+        position = Position(
+            symbol="AAPL",
+            quantity=Decimal("10"),
+            average_price=Decimal("100"),
             realized_pnl=Decimal("0"),
+            current_price=Decimal("110"),
             timestamp=sample_timestamp,
         )
         portfolio = PortfolioState(
-            cash=Decimal("89000"),
-            positions={"EUR_USD": eur_position},
+            cash=Decimal("0"),
+            positions={"AAPL": position},
             timestamp=sample_timestamp,
         )
-        # Missing price for EUR_USD should raise KeyError
-        with pytest.raises(KeyError):
-            portfolio.total_unrealized_pnl({})
+        assert portfolio.total_market_value == Decimal("1100")
+        assert portfolio.total_unrealized_pnl({"AAPL": Decimal("120")}) == Decimal(
+            "200"
+        )
+
+        emptied = portfolio.model_copy(update={"positions": {}})
+        assert emptied.total_market_value == Decimal("0")
+        assert emptied.total_unrealized_pnl({}) == Decimal("0")
+
+    def test_aggregates_track_in_place_position_changes(
+        self, sample_timestamp: datetime, eur_position: Position
+    ) -> None:
+        portfolio = PortfolioState(
+            cash=Decimal("0"),
+            positions={},
+            timestamp=sample_timestamp,
+        )
+        assert portfolio.total_market_value == Decimal("0")
+        assert portfolio.symbols == []
+
+        portfolio.positions["EUR_USD"] = eur_position
+        assert portfolio.total_market_value == eur_position.market_value
+        assert portfolio.equity == eur_position.market_value
+        assert portfolio.symbols == ["EUR_USD"]
 
 
 class TestPortfolioStateImmutability:
@@ -327,31 +252,9 @@ class TestPortfolioStateImmutability:
 class TestPortfolioStateSerialization:
     """Tests for PortfolioState serialization."""
 
-    def test_json_serialization(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        portfolio = PortfolioState(
-            cash=Decimal("89000"),
-            positions={"EUR_USD": eur_position},
-            timestamp=sample_timestamp,
-        )
-        json_str = portfolio.model_dump_json()
-        assert "89000" in json_str
-        assert "EUR_USD" in json_str
-
-    def test_json_roundtrip(self, sample_timestamp: datetime) -> None:
-        eur_position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
+    def test_json_serialize_and_roundtrip(
+        self, sample_timestamp: datetime, eur_position: Position
+    ) -> None:
         portfolio = PortfolioState(
             cash=Decimal("89000"),
             positions={"EUR_USD": eur_position},
@@ -359,10 +262,10 @@ class TestPortfolioStateSerialization:
             timestamp=sample_timestamp,
         )
         json_str = portfolio.model_dump_json()
-        portfolio2 = PortfolioState.model_validate_json(json_str)
-        assert portfolio.cash == portfolio2.cash
-        assert portfolio.realized_pnl == portfolio2.realized_pnl
-        assert len(portfolio.positions) == len(portfolio2.positions)
+        data = json.loads(json_str)
+        assert data["cash"] == "89000"
+        assert data["positions"]["EUR_USD"]["quantity"] == "10000"
+        assert PortfolioState.model_validate_json(json_str) == portfolio
 
     def test_dict_serialization(self, sample_timestamp: datetime) -> None:
         portfolio = PortfolioState(
@@ -373,3 +276,21 @@ class TestPortfolioStateSerialization:
         data = portfolio.model_dump()
         assert "cash" in data
         assert "positions" in data
+
+    def test_pending_orders_dump_as_dicts(self, sample_timestamp: datetime) -> None:
+        order = OrderRequest(
+            symbol="EUR_USD",
+            side="buy",
+            order_type="market",
+            quantity=Decimal("10000"),
+            timestamp=sample_timestamp,
+        )
+        portfolio = PortfolioState(
+            cash=Decimal("100000"),
+            positions={},
+            pending_orders=[order],
+            timestamp=sample_timestamp,
+        )
+        data = portfolio.model_dump()
+        assert data["pending_orders"] == [order.model_dump()]
+        assert data["pending_orders"][0]["side"] == "buy"
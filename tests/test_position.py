@@ -105,6 +105,17 @@ class TestPositionValidation:
                 timestamp=sample_timestamp,
             )
 
+    def test_rejects_unknown_field(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+            Position(
+                symbol="EUR_USD",
+                quantity=Decimal("10000"),
+                average_price=Decimal("1.1000"),
+                realized_pnl=Decimal("0"),
+                timestamp=sample_timestamp,
+                side="long",
+            )
+
 
 class TestPositionDerivedFields:
     """Tests for Position computed properties."""
@@ -145,85 +156,125 @@ class TestPositionDerivedFields:
         assert not position.is_long
         assert not position.is_short
 
-    def test_market_value(self, sample_timestamp: datetime) -> None:
-        position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        # market_value = abs(quantity) * average_price = 10000 * 1.1000 = 11000
-        assert position.market_value == Decimal("11000")
-
-    def test_market_value_short(self, sample_timestamp: datetime) -> None:
+    @pytest.mark.parametrize(
+        ("quantity", "expected"),
+        [
+            # market_value is signed: quantity * average_price
+            ("10000", Decimal("11000")),  # 10000 * 1.1000
+            ("-10000", Decimal("-11000.0000")),  # -10000 * 1.1000
+        ],
+        ids=["long", "short"],
+    )
+    def test_market_value(
+        self, sample_timestamp: datetime, quantity: str, expected: Decimal
+    ) -> None:
         position = Position(
             symbol="EUR_USD",
-            quantity=Decimal("-10000"),
+            quantity=Decimal(quantity),
             average_price=Decimal("1.1000"),
             realized_pnl=Decimal("0"),
             timestamp=sample_timestamp,
         )
-        # market_value is signed: quantity * price = -10000 * 1.1 = -11000
-        assert position.market_value == Decimal("-11000.0000")
-
-    def test_unrealized_pnl_long_profit(self, sample_timestamp: datetime) -> None:
+        assert position.market_value == expected
+
+    @pytest.mark.parametrize(
+        ("quantity", "average_price", "current_price", "expected"),
+        [
+            # unrealized_pnl = (current - average) * quantity
+            ("10000", "1.1000", "1.1050", "50"),  # long profit
+            ("10000", "1.1000", "1.0950", "-50"),  # long loss
+            ("-10000", "1.1000", "1.0950", "50"),  # short profit
+            ("-10000", "1.1000", "1.1050", "-50"),  # short loss
+            ("0", "0", "1.1050", "0"),  # flat
+        ],
+        ids=["long_profit", "long_loss", "short_profit", "short_loss", "flat"],
+    )
+    def test_unrealized_pnl(
+        self,
+        sample_timestamp: datetime,
+        quantity: str,
+        average_price: str,
+        current_price: str,
+        expected: str,
+    ) -> None:
         position = Position(
             symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
+            quantity=Decimal(quantity),
+            average_price=Decimal(average_price),
             realized_pnl=Decimal("0"),
             timestamp=sample_timestamp,
         )
-        current_price = Decimal("1.1050")
-        # For long: (current - avg) * quantity = (1.1050 - 1.1000) * 10000 = 50
-        assert position.unrealized_pnl(current_price) == Decimal("50")
+        assert position.unrealized_pnl(Decimal(current_price)) == Decimal(expected)
 
-    def test_unrealized_pnl_long_loss(self, sample_timestamp: datetime) -> None:
+    def test_avg_entry_falls_back_to_average_price(
+        self, sample_timestamp: datetime
+    ) -> None:
         position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("10000"),
-            average_price=Decimal("1.1000"),
+            symbol="AAPL",
+            quantity=Decimal("10"),
+            average_price=Decimal("150"),
             realized_pnl=Decimal("0"),
             timestamp=sample_timestamp,
         )
-        current_price = Decimal("1.0950")
-        # For long: (current - avg) * quantity = (1.0950 - 1.1000) * 10000 = -50
-        assert position.unrealized_pnl(current_price) == Decimal("-50")
+        assert position.avg_entry_price is None
+        assert position.avg_entry == Decimal("150")
 
-    def test_unrealized_pnl_short_profit(self, sample_timestamp: datetime) -> None:
-        position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("-10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
+    def test_model_validate_leaves_avg_entry_price_unset(
+        self, sample_timestamp: datetime
+    ) -> None:
+        position = Position.model_validate(
+            {
+                "symbol": "AAPL",
+                "quantity": Decimal("10"),
+                "average_price": Decimal("150"),
+                "realized_pnl": Decimal("0"),
+                "timestamp": sample_timestamp,
+            }
         )
-        current_price = Decimal("1.0950")
-        # For short: (current - avg) * quantity = (1.0950 - 1.1000) * -10000 = 50
-        assert position.unrealized_pnl(current_price) == Decimal("50")
+        assert position.avg_entry_price is None
+        assert position.avg_entry == Decimal("150")
 
-    def test_unrealized_pnl_short_loss(self, sample_timestamp: datetime) -> None:
-        position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("-10000"),
-            average_price=Decimal("1.1000"),
-            realized_pnl=Decimal("0"),
-            timestamp=sample_timestamp,
-        )
-        current_price = Decimal("1.1050")
-        # For short: (current - avg) * quantity = (1.1050 - 1.1000) * -10000 = -50
-        assert position.unrealized_pnl(current_price) == Decimal("-50")
+    def test_avg_entry_price_alias_takes_precedence(
+        self, sample_timestamp: datetime
+    ) -> None:
+        data = {
+            "symbol": "AAPL",
+            "quantity": Decimal("10"),
+            "average_price": Decimal("150"),
+            "avg_entry_price": Decimal("155"),
+            "realized_pnl": Decimal("0"),
+            "timestamp": sample_timestamp,
+        }
+        for position in (Position(**data), Position.model_validate(data)):
+            assert position.average_price == Decimal("155")
+            assert position.avg_entry == Decimal("155")
+            assert position.unrealized_pnl(Decimal("160")) == Decimal("50")
+
+    def test_rejects_negative_avg_entry_price(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            Position(
+                symbol="AAPL",
+                quantity=Decimal("10"),
+                average_price=Decimal("150"),
+                avg_entry_price=Decimal("-1"),
+                realized_pnl=Decimal("0"),
+                timestamp=sample_timestamp,
+            )
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == ("avg_entry_price",)
+        assert "avg_entry_price must be >= 0" in error["msg"]
 
-    def test_unrealized_pnl_flat_is_zero(self, sample_timestamp: datetime) -> None:
+    def test_market_value_reset_on_copy(self, sample_timestamp: datetime) -> None:
         position = Position(
-            symbol="EUR_USD",
-            quantity=Decimal("0"),
-            average_price=Decimal("0"),
+            symbol="AAPL",
+            quantity=Decimal("10"),
+            average_price=Decimal("100"),
             realized_pnl=Decimal("0"),
             timestamp=sample_timestamp,
         )
-        assert position.unrealized_pnl(Decimal("1.1050")) == Decimal("0")
+        assert position.market_value == Decimal("1000")
+        marked = position.model_copy(update={"current_price": Decimal("120")})
+        assert marked.market_value == Decimal("1200")
 
 
 class TestPositionImmutability:
@@ -265,11 +316,7 @@ class TestPositionSerialization:
             timestamp=sample_timestamp,
         )
         json_str = position.model_dump_json()
-        position2 = Position.model_validate_json(json_str)
-        assert position.symbol == position2.symbol
-        assert position.quantity == position2.quantity
-        assert position.average_price == position2.average_price
-        assert position.realized_pnl == position2.realized_pnl
+        assert Position.model_validate_json(json_str) == position
 
     def test_dict_serialization(self, sample_timestamp: datetime) -> None:
         position = Position(
@@ -282,3 +329,21 @@ class TestPositionSerialization:
         data = position.model_dump()
         assert data["symbol"] == "EUR_USD"
         assert "quantity" in data
+
+
+class TestPositionConstructUnchecked:
+    """Tests for the trusted Position constructor."""
+
+    def test_matches_validated_position(self, sample_timestamp: datetime) -> None:
+        values = {
+            "symbol": "AAPL",
+            "quantity": Decimal("10"),
+            "average_price": Decimal("150"),
+            "realized_pnl": Decimal("0"),
+            "timestamp": sample_timestamp,
+        }
+        position = Position.construct_unchecked(**values)
+        assert position == Position(**values)
+        assert position.current_price is None
+        assert position.market_value == Decimal("1500")
+        assert position.model_dump(exclude_unset=True).keys() == values.keys()
@@ -106,6 +106,22 @@ class TestQuoteValidation:
                 ask_size=Decimal("1000000"),
             )
 
+    def test_reports_each_invalid_field(self) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            Quote(
+                symbol="EUR_USD",
+                timestamp=datetime(2024, 1, 15, 10, 30),
+                bid=Decimal("0"),
+                ask=Decimal("1.1000"),
+                bid_size=Decimal("1000000"),
+                ask_size=Decimal("-100"),
+            )
+        assert [e["loc"] for e in exc_info.value.errors()] == [
+            ("timestamp",),
+            ("bid",),
+            ("ask_size",),
+        ]
+
     def test_rejects_crossed_market(self, sample_timestamp: datetime) -> None:
         with pytest.raises(ValidationError):
             Quote(
@@ -128,6 +144,18 @@ class TestQuoteValidation:
                 ask_size=Decimal("1000000"),
             )
 
+    def test_rejects_unknown_field(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+            Quote(
+                symbol="EUR_USD",
+                timestamp=sample_timestamp,
+                bid=Decimal("1.1000"),
+                ask=Decimal("1.1002"),
+                bid_size=Decimal("0"),
+                ask_size=Decimal("0"),
+                last=Decimal("1.1001"),
+            )
+
 
 class TestQuoteDerivedFields:
     """Tests for Quote computed properties."""
@@ -179,6 +207,25 @@ class TestQuoteDerivedFields:
         assert quote.spread == Decimal("0")
         assert quote.spread_bps == Decimal("0")
 
+    def test_derived_fields_are_cached_and_reset_on_copy(
+        self, sample_timestamp: datetime
+    ) -> None:
+        quote = Quote(
+            symbol="EUR_USD",
+            timestamp=sample_timestamp,
+            bid=Decimal("1.1000"),
+            ask=Decimal("1.1002"),
+            bid_size=Decimal("1000000"),
+            ask_size=Decimal("1000000"),
+        )
+        assert quote.mid is quote.mid
+        assert quote.spread == Decimal("0.0002")
+        assert "mid" not in quote.model_dump()
+
+        wider = quote.model_copy(update={"ask": Decimal("1.1010")})
+        assert wider.spread == Decimal("0.0010")
+        assert wider.mid == Decimal("1.1005")
+
 
 class TestQuoteSerialization:
     """Tests for Quote serialization."""
@@ -193,7 +240,49 @@ class TestQuoteSerialization:
             ask_size=Decimal("1000000"),
         )
         json_str = quote.model_dump_json()
-        quote2 = Quote.model_validate_json(json_str)
-        assert quote.symbol == quote2.symbol
-        assert quote.bid == quote2.bid
-        assert quote.ask == quote2.ask
+        assert Quote.model_validate_json(json_str) == quote
+
+
+class TestQuoteConstructUnchecked:
+    """Tests for the trusted Quote constructor."""
+
+    def test_matches_validated_quote(self, sample_timestamp: datetime) -> None:
+        values = {
+            "symbol": "EUR_USD",
+            "timestamp": sample_timestamp,
+            "bid": Decimal("1.1000"),
+            "ask": Decimal("1.1002"),
+            "bid_size": Decimal("1000000"),
+            "ask_size": Decimal("500000"),
+        }
+        quote = Quote.construct_unchecked(**values)
+        assert quote == Quote(**values)
+        assert quote.mid == Decimal("1.1001")
+        assert quote.model_dump()["bid"] == "1.1000"
+
+    def test_skips_validation(self, sample_timestamp: datetime) -> None:
+        quote = Quote.construct_unchecked(
+            symbol="EUR_USD",
+            timestamp=sample_timestamp,
+            bid=Decimal("2"),
+            ask=Decimal("1"),
+            bid_size=Decimal("0"),
+            ask_size=Decimal("0"),
+        )
+        assert quote.spread == Decimal("-1")
+
+    def test_instances_share_fields_set(self, sample_timestamp: datetime) -> None:
+        values = {
+            "symbol": "EUR_USD",
+            "timestamp": sample_timestamp,
+            "bid": Decimal("1.1000"),
+            "ask": Decimal("1.1002"),
+            "bid_size": Decimal("0"),
+            "ask_size": Decimal("0"),
+        }
+        first = Quote.construct_unchecked(**values)
+        second = Quote.construct_unchecked(**values)
+        assert first.model_fields_set is second.model_fields_set
+        copied = first.model_copy(update={"bid": Decimal("1.1001")})
+        assert copied.model_fields_set is not first.model_fields_set
+        assert first.model_fields_set == set(values)
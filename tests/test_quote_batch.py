@@ -0,0 +1,96 @@
+"""Tests for liq.core.quote_batch module."""
+
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from liq.core import Quote, QuoteBatch
+
+ColumnBuilder = Callable[..., dict[str, Any]]
+
+
+class TestQuoteBatch:
+    """Tests for QuoteBatch construction, row access and aggregates."""
+
+    def test_from_columns_matches_quotes(self, quote_columns: ColumnBuilder) -> None:
+        cols = quote_columns()
+        batch = QuoteBatch.from_columns(**cols)
+        assert len(batch) == 3
+        assert batch.symbols == ("EUR_USD",) * 3
+        expected = [
+            Quote(
+                symbol=cols["symbol"],
+                timestamp=ts,
+                bid=bid,
+                ask=ask,
+                bid_size=bid_size,
+                ask_size=ask_size,
+            )
+            for ts, bid, ask, bid_size, ask_size in zip(
+                cols["timestamps"],
+                cols["bids"],
+                cols["asks"],
+                cols["bid_sizes"],
+                cols["ask_sizes"],
+                strict=True,
+            )
+        ]
+        assert batch.to_quotes() == expected
+        assert list(batch) == expected
+
+    def test_from_quotes_round_trip(self, quote_columns: ColumnBuilder) -> None:
+        quotes = QuoteBatch.from_columns(**quote_columns()).to_quotes()
+        assert QuoteBatch.from_quotes(quotes).to_quotes() == quotes
+
+    def test_aggregates_match_quote_properties(
+        self, quote_columns: ColumnBuilder
+    ) -> None:
+        batch = QuoteBatch.from_columns(**quote_columns())
+        quotes = batch.to_quotes()
+        assert batch.mids() == [q.mid for q in quotes]
+        assert batch.spreads() == [q.spread for q in quotes]
+        assert batch.spreads_bps() == [q.spread_bps for q in quotes]
+
+    def test_per_row_symbols(self, quote_columns: ColumnBuilder) -> None:
+        cols = quote_columns(2)
+        cols["symbol"] = ["eur_usd", "GBP_USD"]
+        batch = QuoteBatch.from_columns(**cols)
+        assert batch.row(1).symbol == "GBP_USD"
+
+    @pytest.mark.parametrize(
+        ("column", "value", "message"),
+        [
+            ("bids", Decimal("0"), "row 1: bid must be > 0"),
+            ("asks", Decimal("1.0"), "row 1: ask must be >= bid"),
+            ("ask_sizes", Decimal("-1"), "row 1: ask_size must be >= 0"),
+            ("timestamps", datetime(2024, 1, 15), "row 1: timestamp must be"),
+        ],
+    )
+    def test_rejects_invalid_row(
+        self, quote_columns: ColumnBuilder, column: str, value: object, message: str
+    ) -> None:
+        cols = quote_columns()
+        cols[column][1] = value
+        with pytest.raises(ValueError, match=message):
+            QuoteBatch.from_columns(**cols)
+
+    def test_rejects_mismatched_lengths(self, quote_columns: ColumnBuilder) -> None:
+        cols = quote_columns()
+        cols["asks"] = cols["asks"][:2]
+        with pytest.raises(ValueError, match="same length"):
+            QuoteBatch.from_columns(**cols)
+
+    def test_rejects_invalid_symbol_row(self, quote_columns: ColumnBuilder) -> None:
+        cols = quote_columns(2)
+        cols["symbol"] = ["EUR_USD", "eur/usd"]
+        with pytest.raises(ValueError, match="row 1"):
+            QuoteBatch.from_columns(**cols)
+
+    def test_empty_batch(self) -> None:
+        batch = QuoteBatch.from_quotes([])
+        assert len(batch) == 0
+        assert batch.mids() == []
+        assert batch.spreads_bps() == []
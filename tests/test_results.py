@@ -1,5 +1,7 @@
 """Tests for result data models."""
 
+from dataclasses import asdict
+
 import pytest
 
 from liq.core.results import BatchResult, FetchResult, UpdateResult
@@ -106,7 +108,16 @@ class TestBatchResult:
         assert batch.total == 3
         assert batch.succeeded == 2
         assert batch.failed == 1
-        assert len(batch.results) == 3
+        assert batch.results == results
+
+    def test_results_stay_a_list(self) -> None:
+        """Test that results keep the list type callers passed in."""
+        results = [FetchResult(symbol="EUR_USD", success=True, count=5000)]
+        batch = BatchResult(total=1, succeeded=1, failed=0, results=results)
+        assert isinstance(batch.results, list)
+        assert batch.results == [
+            FetchResult(symbol="EUR_USD", success=True, count=5000)
+        ]
 
     def test_update_batch_result(self) -> None:
         """Test creating a batch result with update results."""
@@ -164,6 +175,26 @@ class TestBatchResult:
         assert len(successes) == 2
         assert all(r.success for r in successes)
 
+    def test_partitions_preserve_order_and_are_fresh_lists(self) -> None:
+        """Partitions keep input order and callers get independent lists."""
+        results = [
+            FetchResult(symbol="EUR_USD", success=False, error="timeout"),
+            FetchResult(symbol="GBP_USD", success=True, count=10),
+            FetchResult(symbol="JPY_USD", success=False, error="Not found"),
+        ]
+        batch = BatchResult(total=3, succeeded=1, failed=2, results=results)
+        failures = batch.get_failures()
+        assert [r.symbol for r in failures] == ["EUR_USD", "JPY_USD"]
+        failures.clear()
+        assert len(batch.get_failures()) == 2
+        assert batch == BatchResult(total=3, succeeded=1, failed=2, results=results)
+
+    def test_asdict_has_only_declared_fields(self) -> None:
+        """Test that asdict exposes only the batch fields."""
+        results = [FetchResult(symbol="EUR_USD", success=True, count=5000)]
+        batch = BatchResult(total=1, succeeded=1, failed=0, results=results)
+        assert list(asdict(batch)) == ["total", "succeeded", "failed", "results"]
+
     def test_totals_must_match(self) -> None:
         """Test that total must equal succeeded + failed."""
         results = [FetchResult(symbol="EUR_USD", success=True, count=5000)]
@@ -1,7 +1,14 @@
 """Tests for liq.core.symbols module."""
 
+import pytest
+
 from liq.core.enums import AssetClass
-from liq.core.symbols import normalize_symbol, parse_symbol, validate_symbol
+from liq.core.symbols import (
+    normalize_symbol,
+    normalize_symbols,
+    parse_symbol,
+    validate_symbol,
+)
 
 
 class TestNormalizeSymbol:
@@ -36,6 +43,9 @@ class TestNormalizeSymbol:
     def test_normalize_crypto_with_exchange_prefix(self) -> None:
         assert normalize_symbol("BINANCE:BTCUSDT", AssetClass.CRYPTO) == "BTC-USDT"
 
+    def test_normalize_keeps_text_after_last_colon(self) -> None:
+        assert normalize_symbol("NASDAQ:US:aapl", AssetClass.EQUITY) == "AAPL"
+
     def test_normalize_crypto_already_hyphenated(self) -> None:
         assert normalize_symbol("BTC-USD", AssetClass.CRYPTO) == "BTC-USD"
 
@@ -45,6 +55,17 @@ class TestNormalizeSymbol:
     def test_normalize_crypto_sol_usdc(self) -> None:
         assert normalize_symbol("SOLUSDC", AssetClass.CRYPTO) == "SOL-USDC"
 
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("USDT", "USDT"),  # quote alone has no base currency
+            ("BUSD", "B-USD"),  # shorter quote matches when longer one has no base
+            ("XYZABC", "XYZ-ABC"),  # unknown quote falls back to 3-char base
+        ],
+    )
+    def test_normalize_crypto_quote_edge_cases(self, raw: str, expected: str) -> None:
+        assert normalize_symbol(raw, AssetClass.CRYPTO) == expected
+
     # Equity normalization
     def test_normalize_equity_uppercase(self) -> None:
         assert normalize_symbol("AAPL", AssetClass.EQUITY) == "AAPL"
@@ -58,6 +79,28 @@ class TestNormalizeSymbol:
     def test_normalize_equity_tsla(self) -> None:
         assert normalize_symbol("tsla", AssetClass.EQUITY) == "TSLA"
 
+    def test_normalize_interns_result(self) -> None:
+        first = normalize_symbol("eur/usd", AssetClass.FOREX)
+        assert normalize_symbol("EURUSD", AssetClass.FOREX) is first
+        assert normalize_symbol(" EUR-USD ", AssetClass.FOREX) is first
+
+    def test_normalize_accepts_asset_class_value(self) -> None:
+        assert normalize_symbol("eur/usd", "forex") == "EUR_USD"  # type: ignore[arg-type]
+        assert normalize_symbol("btcusd", "crypto") == "BTC-USD"  # type: ignore[arg-type]
+
+
+class TestNormalizeSymbols:
+    """Tests for normalize_symbols batch function."""
+
+    def test_matches_scalar_normalization_in_order(self) -> None:
+        raws = ["eur/usd", "GBPUSD", "EURUSD", "eur/usd", "usd-jpy"]
+        result = normalize_symbols(raws, AssetClass.FOREX)
+        assert result == [normalize_symbol(r, AssetClass.FOREX) for r in raws]
+        assert result[0] is result[2]
+
+    def test_empty_column(self) -> None:
+        assert normalize_symbols([], AssetClass.CRYPTO) == []
+
 
 class TestParseSymbol:
     """Tests for parse_symbol function."""
@@ -130,9 +173,19 @@ class TestValidateSymbol:
     def test_validate_empty_invalid(self) -> None:
         assert validate_symbol("") is False
 
+    @pytest.mark.parametrize("symbol", [None, 123, ["EUR_USD"]])
+    def test_validate_non_string_invalid(self, symbol: object) -> None:
+        assert validate_symbol(symbol) is False  # type: ignore[arg-type]
+
     def test_validate_colon_invalid(self) -> None:
         assert validate_symbol("BINANCE:BTCUSDT") is False
 
+    @pytest.mark.parametrize(
+        "symbol", ["_EUR", "EUR-", "EUR_USD\n", "ÉUR_USD", "EUR\x00USD"]
+    )
+    def test_validate_bad_edges_and_bytes_invalid(self, symbol: str) -> None:
+        assert validate_symbol(symbol) is False
+
 
 class TestSymbolRoundTrip:
     """Integration tests for symbol normalization round-trips."""
@@ -189,6 +242,13 @@ class TestEdgeCases:
         """Single character symbols are invalid."""
         assert validate_symbol("A") is False
 
+    def test_repeated_calls_return_same_result(self) -> None:
+        for _ in range(2):
+            assert normalize_symbol("gbp/usd", AssetClass.FOREX) == "GBP_USD"
+            assert validate_symbol("GBP_USD") is True
+            assert validate_symbol("gbp/usd") is False
+            assert validate_symbol(None) is False  # type: ignore[arg-type]
+
     def test_validate_very_long_symbol(self) -> None:
         """Very long symbols should be invalid (arbitrary limit)."""
         assert validate_symbol("A" * 50) is False
@@ -1,12 +1,19 @@
 """Tests for liq.core.validation module."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, tzinfo
 
 import pytest
 
 from liq.core.validation import ValidationResult, is_timezone_aware
 
 
+class _NoOffset(tzinfo):
+    """tzinfo that does not know its offset (naive per the datetime docs)."""
+
+    def utcoffset(self, _dt: datetime | None) -> timedelta | None:
+        return None
+
+
 class TestValidationResult:
     """Tests for ValidationResult dataclass."""
 
@@ -16,6 +23,25 @@ class TestValidationResult:
         assert result.errors == []
         assert result.warnings == []
 
+    def test_errors_and_warnings_default_to_empty(self) -> None:
+        result = ValidationResult(is_valid=True)
+        assert result.errors == ()
+        assert result.warnings == ()
+        assert result.errors is ValidationResult(is_valid=False).errors
+
+    def test_default_errors_and_warnings_are_tuples(self) -> None:
+        result = ValidationResult(is_valid=True)
+        assert isinstance(result.errors, tuple)
+        assert isinstance(result.warnings, tuple)
+        assert result.errors != []
+        assert not hasattr(result.errors, "append")
+
+    def test_given_lists_are_kept(self) -> None:
+        errors = ["high < low"]
+        result = ValidationResult(is_valid=False, errors=errors, warnings=[])
+        assert result.errors is errors
+        assert result.warnings == []
+
     def test_invalid_result_with_errors(self) -> None:
         result = ValidationResult(
             is_valid=False, errors=["high < low", "volume < 0"], warnings=[]
@@ -37,6 +63,10 @@ class TestValidationResult:
         with pytest.raises(AttributeError):
             result.is_valid = False  # type: ignore[misc]
 
+    def test_result_is_slotted(self) -> None:
+        result = ValidationResult(is_valid=True, errors=[], warnings=[])
+        assert not hasattr(result, "__dict__")
+
     def test_result_equality(self) -> None:
         result1 = ValidationResult(is_valid=True, errors=[], warnings=[])
         result2 = ValidationResult(is_valid=True, errors=[], warnings=[])
@@ -71,3 +101,7 @@ class TestIsTimezoneAware:
     def test_now_without_tz_is_not_aware(self) -> None:
         dt = datetime.now()
         assert is_timezone_aware(dt) is False
+
+    def test_tzinfo_without_offset_is_not_aware(self) -> None:
+        dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=_NoOffset())
+        assert is_timezone_aware(dt) is False
@@ -0,0 +1,54 @@
+"""Tests for liq.core._validators shared field checks."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from liq.core import CashMovement, LedgerEntry, PortfolioState, Quote
+from liq.core._validators import canonical_symbol, require_aware
+
+
+class TestSharedValidators:
+    """Tests for validators shared across models."""
+
+    def test_canonical_symbol_normalizes(self) -> None:
+        assert canonical_symbol(" eur_usd ") == "EUR_USD"
+
+    def test_canonical_symbol_rejects_invalid(self) -> None:
+        with pytest.raises(ValueError, match="symbol must be canonical"):
+            canonical_symbol("eur/usd")
+
+    def test_models_share_one_callable(self) -> None:
+        decorators = [
+            m.__pydantic_decorators__.field_validators["validate_timestamp_timezone"]
+            for m in (CashMovement, LedgerEntry, PortfolioState)
+        ]
+        assert all(d.func is require_aware for d in decorators)
+
+    def test_error_names_the_field(self, sample_timestamp: datetime) -> None:
+        with pytest.raises(ValidationError, match="ask must be > 0"):
+            Quote(
+                symbol="EUR_USD",
+                timestamp=sample_timestamp,
+                bid=Decimal("1.1"),
+                ask=Decimal("0"),
+                bid_size=Decimal("1"),
+                ask_size=Decimal("1"),
+            )
+        with pytest.raises(ValidationError, match="timestamp must be timezone-aware"):
+            Quote(
+                symbol="EUR_USD",
+                timestamp=datetime(2024, 1, 15),
+                bid=Decimal("1.1"),
+                ask=Decimal("1.2"),
+                bid_size=Decimal("1"),
+                ask_size=Decimal("1"),
+            )
+
+    def test_canonical_symbol_is_interned(self) -> None:
+        raw = "".join(["btc", "-", "usd"])
+        canonical = "".join(["BTC", "-", "USD"])
+        assert canonical_symbol(raw) is canonical_symbol(canonical)
+        assert canonical_symbol(canonical) == canonical